@@ -3,11 +3,22 @@ GitHub API client for fetching PR data and metrics.
 """
 
 import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Any
+from ai_impact_analysis.utils.core_utils import load_json_file, parse_date, save_json_file
 from ai_impact_analysis.utils.logger import logger
 
+# Default size of the keep-alive connection pool; matches the default --workers of get_pr_metrics
+DEFAULT_POOL_SIZE = 20
+
+# Longest wait for an exhausted primary rate limit to reset before failing with an error
+_MAX_RATE_LIMIT_WAIT_SECONDS = 15 * 60
+
 
 class GitHubClient:
     """Client for interacting with GitHub API to fetch PR data."""
@@ -32,6 +43,9 @@ class GitHubClient:
         token: Optional[str] = None,
         repo_owner: Optional[str] = None,
         repo_name: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize GitHub API client.
@@ -40,6 +54,10 @@ class GitHubClient:
             token: GitHub personal access token (or use GITHUB_TOKEN env var)
             repo_owner: Repository owner/organization (or use GITHUB_REPO_OWNER env var)
             repo_name: Repository name (or use GITHUB_REPO_NAME env var)
+            pool_size: Maximum number of pooled connections kept open to the API
+            cache_dir: Directory for caching per-PR metrics, with one <owner>/<repo>
+                subdirectory per repository (default: .cache/github/pr_metrics)
+            use_cache: Reuse cached metrics of already analyzed PRs
         """
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.repo_owner = repo_owner or os.getenv("GITHUB_REPO_OWNER")
@@ -62,6 +80,21 @@ class GitHubClient:
             "X-GitHub-Api-Version": "2022-11-28",
         }
 
+        # Shared session so concurrent PR analysis reuses keep-alive connections; transient
+        # gateway errors and secondary rate limits (429) are retried with backoff (honouring
+        # Retry-After) instead of failing the PR outright. An exhausted primary rate limit
+        # (403 with no requests remaining) is handled by _get.
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+
+        # One subdirectory per repository, since PR numbers are only unique within a repo
+        self.cache_dir = (
+            Path(cache_dir or ".cache/github/pr_metrics") / self.repo_owner / self.repo_name
+        )
+        self.use_cache = use_cache
+
         logger.info(f"GitHub client initialized for {self.repo_owner}/{self.repo_name}")
 
     @staticmethod
@@ -79,6 +112,89 @@ class GitHubClient:
             return False
         return username.lower() in GitHubClient.BOT_USERS or username.lower().endswith("[bot]")
 
+    @staticmethod
+    def _is_rate_limited(response) -> bool:
+        """Check if a response reports an exhausted primary rate limit (403/429, none left)."""
+        return (
+            response.status_code in (403, 429)
+            and response.headers.get("X-RateLimit-Remaining") == "0"
+        )
+
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Send a GET request to the GitHub API, waiting out an exhausted primary rate limit.
+
+        GitHub answers with 403 and X-RateLimit-Remaining: 0 once the hourly quota is used
+        up. The request is retried once after X-RateLimit-Reset if that is near enough;
+        otherwise the call fails with an error naming the reset time.
+
+        Args:
+            url: API URL
+            params: Optional query parameters
+
+        Returns:
+            Response object (status not yet checked)
+
+        Raises:
+            requests.exceptions.HTTPError: If the rate limit does not reset soon enough
+        """
+        response = self.session.get(url, headers=self.headers, params=params)
+        if not self._is_rate_limited(response):
+            return response
+
+        reset_at = int(response.headers.get("X-RateLimit-Reset", 0))
+        wait_seconds = max(reset_at - time.time(), 0) + 1
+        if wait_seconds > _MAX_RATE_LIMIT_WAIT_SECONDS:
+            raise requests.exceptions.HTTPError(
+                "GitHub API rate limit exhausted; it resets at "
+                f"{datetime.fromtimestamp(reset_at):%Y-%m-%d %H:%M:%S}. "
+                "Retry after that, or use the GraphQL API.",
+                response=response,
+            )
+
+        logger.warning(f"GitHub API rate limit exhausted; waiting {wait_seconds:.0f}s for reset")
+        time.sleep(wait_seconds)
+        response = self.session.get(url, headers=self.headers, params=params)
+        if self._is_rate_limited(response):
+            raise requests.exceptions.HTTPError(
+                "GitHub API rate limit still exhausted after waiting for its reset",
+                response=response,
+            )
+        return response
+
+    def _get_cache_file(self, pr_number: int) -> Path:
+        """Return the cache file path for a PR's detailed metrics."""
+        return self.cache_dir / f"pr_{pr_number}.json"
+
+    def _load_from_cache(self, pr: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Load cached metrics for a PR, or None if missing or cached for another merge."""
+        cache_file = self._get_cache_file(pr["number"])
+        try:
+            metrics = load_json_file(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load cache file {cache_file}: {e}")
+            return None
+        return metrics if metrics.get("merged_at") == pr["merged_at"] else None
+
+    def _save_to_cache(self, metrics: Dict[str, Any]):
+        """Save a PR's detailed metrics to the cache, replacing any previous entry atomically."""
+        cache_file = self._get_cache_file(metrics["pr_number"])
+        tmp_file = cache_file.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            save_json_file(metrics, tmp_file, indent=False)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to save cache file {cache_file}: {e}")
+
+    def clear_cache(self):
+        """Delete the cached PR metrics of this client's repository."""
+        for cache_file in self.cache_dir.glob("pr_*.json"):
+            cache_file.unlink(missing_ok=True)
+        logger.info(f"Cleared PR metrics cache for {self.repo_owner}/{self.repo_name}")
+
     def fetch_merged_prs(
         self, start_date: str, end_date: str, per_page: int = 100
     ) -> List[Dict[str, Any]]:
@@ -108,7 +224,7 @@ class GitHubClient:
             }
 
             logger.debug(f"Fetching PRs page {page}...")
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._get(url, params=params)
             response.raise_for_status()
 
             prs = response.json()
@@ -128,8 +244,8 @@ class GitHubClient:
                     continue
 
                 merged_date = datetime.strptime(pr["merged_at"], "%Y-%m-%dT%H:%M:%SZ")
-                start = datetime.strptime(start_date, "%Y-%m-%d")
-                end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+                start = parse_date(start_date)
+                end = parse_date(end_date) + timedelta(days=1)
 
                 if start <= merged_date < end:
                     all_prs.append(pr)
@@ -163,7 +279,7 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}"
 
-        response = requests.get(url, headers=self.headers)
+        response = self._get(url)
         response.raise_for_status()
 
         return response.json()
@@ -180,7 +296,7 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/commits"
 
-        response = requests.get(url, headers=self.headers)
+        response = self._get(url)
         response.raise_for_status()
 
         return response.json()
@@ -197,7 +313,7 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/reviews"
 
-        response = requests.get(url, headers=self.headers)
+        response = self._get(url)
         response.raise_for_status()
 
         return response.json()
@@ -217,7 +333,7 @@ class GitHubClient:
         """
         # Get review comments (inline comments on code)
         url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/comments"
-        response = requests.get(url, headers=self.headers)
+        response = self._get(url)
         response.raise_for_status()
         review_comments = response.json()
 
@@ -225,14 +341,14 @@ class GitHubClient:
         url = (
             f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/issues/{pr_number}/comments"
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._get(url)
         response.raise_for_status()
         issue_comments = response.json()
 
         # Use provided reviews or fetch if not provided
         if reviews is None:
             url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/reviews"
-            response = requests.get(url, headers=self.headers)
+            response = self._get(url)
             response.raise_for_status()
             reviews = response.json()
 
@@ -310,12 +426,27 @@ class GitHubClient:
         """
         Get detailed metrics for a single PR.
 
+        Merged PRs do not change, so results are cached on disk keyed by PR number and
+        merge time, and repeat runs skip the API calls entirely.
+
         Args:
             pr: PR dictionary from GitHub API
 
         Returns:
             Dictionary with detailed metrics
         """
+        if self.use_cache:
+            cached = self._load_from_cache(pr)
+            if cached is not None:
+                return cached
+
+        metrics = self._analyze_pr(pr)
+        if self.use_cache:
+            self._save_to_cache(metrics)
+        return metrics
+
+    def _analyze_pr(self, pr: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch a PR's details, commits, reviews and comments and compute its metrics."""
         pr_number = pr["number"]
 
         # Get full PR details to ensure we have diff statistics
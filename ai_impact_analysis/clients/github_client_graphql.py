@@ -15,6 +15,7 @@ import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
+from ai_impact_analysis.utils.core_utils import parse_date
 from ai_impact_analysis.utils.logger import logger
 
 
@@ -297,8 +298,8 @@ class GitHubGraphQLClient:
                     continue
 
                 # Filter by date range
-                start = datetime.strptime(start_date, "%Y-%m-%d")
-                end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+                start = parse_date(start_date)
+                end = parse_date(end_date) + timedelta(days=1)
 
                 if not (start <= merged_at < end):
                     filtered_reasons["date_out_of_range"] += 1
@@ -331,7 +332,7 @@ class GitHubGraphQLClient:
             # If we've checked 10 pages without finding anything, and
             # the oldest merged PR we've seen is still after our end_date, stop
             if page >= 10 and len(all_prs) == 0 and oldest_merged_in_page:
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+                end_dt = parse_date(end_date)
                 if oldest_merged_in_page > end_dt:
                     logger.info(
                         f"After {page} pages, oldest merged PR ({oldest_merged_in_page.date()}) is still after end date ({end_date})"
@@ -469,8 +470,8 @@ class GitHubGraphQLClient:
 
         # Filter by date range
         merged_at = datetime.strptime(pr_node["mergedAt"], "%Y-%m-%dT%H:%M:%SZ")
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+        start = parse_date(start_date)
+        end = parse_date(end_date) + timedelta(days=1)
 
         if not (start <= merged_at < end):
             logger.debug(
@@ -5,15 +5,45 @@ Core business logic for fetching Jira data and calculating metrics.
 Extracted from cli/get_jira_metrics.py
 """
 
+import hashlib
 import os
 import json
+import threading
+import time
 import requests
-from datetime import datetime
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
+from ai_impact_analysis.utils.core_utils import (
+    convert_date_to_jql,
+    load_json_file,
+    loads_json,
+    parse_datetime,
+    save_json_file,
+)
+from ai_impact_analysis.utils.logger import logger
 from ai_impact_analysis.utils.report_utils import normalize_username
 from ai_impact_analysis.utils.workflow_utils import load_team_members_from_yaml
 
+# Upper bound on concurrent page requests; keeps us well under Jira's rate limits
+_MAX_FETCH_WORKERS = 8
+
+# Only the issue fields the metrics actually read; anything more is wasted payload
+_ISSUE_FIELDS = "created,resolutiondate,status,issuetype"
+
+# Custom field holding story points on the Jira instance
+_STORY_POINTS_FIELD = "customfield_12310243"
+
+# Default page size; Jira may cap this lower, which _fetch_pages detects and adapts to
+DEFAULT_BATCH_SIZE = 500
+
+# Cached API pages older than this are refetched, so recently resolved issues show up
+_CACHE_TTL_SECONDS = 24 * 3600
+
 
 class JiraMetricsCalculator:
     """
@@ -21,7 +51,9 @@ class JiraMetricsCalculator:
     state durations, and velocity.
     """
 
-    def __init__(self, jira_url=None, jira_token=None, project_key=None):
+    def __init__(
+        self, jira_url=None, jira_token=None, project_key=None, cache_dir=None, use_cache=True
+    ):
         """
         Initialize the Jira metrics calculator.
 
@@ -29,6 +61,8 @@ class JiraMetricsCalculator:
             jira_url: Jira instance URL (default: from JIRA_URL env var)
             jira_token: Jira API token (default: from JIRA_API_TOKEN env var)
             project_key: Project key (default: from JIRA_PROJECT_KEY env var)
+            cache_dir: Directory for caching API responses (default: .cache/jira)
+            use_cache: Reuse cached API responses younger than a day
         """
         self.jira_url = jira_url or os.getenv("JIRA_URL", "https://issues.redhat.com")
         self.jira_token = jira_token or os.getenv("JIRA_API_TOKEN")
@@ -37,7 +71,70 @@ class JiraMetricsCalculator:
         # Setup authentication headers
         self.headers = {"Accept": "application/json", "authorization": f"Bearer {self.jira_token}"}
 
-    def fetch_jira_data(self, jql_query, start_at=0, max_results=50, expand=None):
+        # Shared session so concurrent page fetches reuse pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", requests.adapters.HTTPAdapter(pool_maxsize=_MAX_FETCH_WORKERS)
+        )
+
+        self.cache_dir = Path(cache_dir or ".cache/jira")
+        self.use_cache = use_cache
+        if use_cache:
+            self._prune_cache()
+
+    def _get_cache_file(self, url, params):
+        """Return the cache file path for a search request."""
+        key = hashlib.md5(json.dumps([url, params], sort_keys=True).encode()).hexdigest()
+        return self.cache_dir / f"search_{key}.json"
+
+    def _prune_cache(self):
+        """
+        Delete cached API responses older than the cache TTL.
+
+        JQL date filters are relative ("-30d"), so the same report run on another day uses
+        new cache keys and its old entries would otherwise never be read or removed again.
+        """
+        cutoff = time.time() - _CACHE_TTL_SECONDS
+        # Also matches temporary files left behind by an interrupted _save_to_cache
+        for cache_file in self.cache_dir.glob("search_*"):
+            try:
+                if cache_file.stat().st_mtime < cutoff:
+                    cache_file.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"Failed to remove cache file {cache_file}: {e}")
+
+    def _load_from_cache(self, cache_file):
+        """Load a cached API response, or None if it is missing or stale (stale ones are deleted)."""
+        try:
+            if time.time() - cache_file.stat().st_mtime > _CACHE_TTL_SECONDS:
+                cache_file.unlink(missing_ok=True)
+                return None
+            return load_json_file(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load cache file {cache_file}: {e}")
+            return None
+
+    def _save_to_cache(self, cache_file, data):
+        """Save an API response to the cache, replacing any previous entry atomically."""
+        # Unique per process and thread, so concurrent runs never share a temporary file
+        tmp_file = cache_file.with_name(
+            f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            save_json_file(data, tmp_file, indent=False)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to save cache file {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def fetch_jira_data(
+        self, jql_query, start_at=0, max_results=50, expand=None, fields=_ISSUE_FIELDS
+    ):
         """
         Generic function for fetching Jira issue data with pagination.
 
@@ -46,6 +143,7 @@ class JiraMetricsCalculator:
             start_at: Pagination start index
             max_results: Maximum results per page
             expand: Fields to expand (e.g., "changelog")
+            fields: Comma-separated issue fields to return
 
         Returns:
             JSON response data or None on error
@@ -54,7 +152,7 @@ class JiraMetricsCalculator:
 
         params = {
             "jql": jql_query,
-            "fields": "created,resolutiondate,status,issuetype,timeoriginalestimate,timetracking",
+            "fields": fields,
             "startAt": start_at,
             "maxResults": max_results,
         }
@@ -62,38 +160,48 @@ class JiraMetricsCalculator:
         if expand:
             params["expand"] = expand
 
-        print("\n[DEBUG] === Jira API Request ===")
-        print(f"[DEBUG] URL: {url}")
-        print(f"[DEBUG] JQL Query: {jql_query}")
-        print("[DEBUG] Parameters:")
-        for key, value in params.items():
-            print(f"[DEBUG]   {key}: {value}")
-        print("[DEBUG] =========================\n")
+        cache_file = self._get_cache_file(url, params) if self.use_cache else None
+        if cache_file is not None:
+            cached_data = self._load_from_cache(cache_file)
+            if cached_data is not None:
+                return cached_data
+
+        # Lazy %-formatting: nothing is rendered unless debug logging is enabled
+        logger.debug("Jira API request: %s", url)
+        logger.debug("JQL query: %s", jql_query)
+        logger.debug("Parameters: %s", params)
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
 
-            print(f"[DEBUG] Response Status Code: {response.status_code}")
-            print(f"[DEBUG] Response URL: {response.url}")
+            logger.debug("Response status code: %s", response.status_code)
+            logger.debug("Response URL: %s", response.url)
 
             if not response.ok:
-                print(f"[DEBUG] Error Response: {response.text}")
+                logger.debug("Error response: %s", response.text)
 
             response.raise_for_status()
-            return response.json()
+            data = loads_json(response.content)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching Jira data: {e}")
-            print(f"[DEBUG] Request failed with exception: {type(e).__name__}")
+            logger.debug("Request failed with exception: %s", type(e).__name__)
             if hasattr(e, "response") and e.response is not None:
-                print(f"[DEBUG] Response text: {e.response.text}")
+                logger.debug("Response text: %s", e.response.text)
             return None
 
-    def calculate_state_durations(self, issue):
+        if cache_file is not None:
+            self._save_to_cache(cache_file, data)
+        return data
+
+    def calculate_state_durations(self, issue, created_date=None, end_date=None, now=None):
         """
         Calculate the time spent in each state for an issue and the number of occurrences.
 
         Args:
             issue: Jira issue dict with changelog data
+            created_date: Already-parsed creation datetime (parsed from the issue if omitted)
+            end_date: Already-parsed resolution datetime (parsed from the issue if omitted)
+            now: Timezone-aware end time for unresolved issues (current time if omitted)
 
         Returns:
             Dictionary containing total time (seconds) and occurrence count for each state
@@ -103,89 +211,70 @@ class JiraMetricsCalculator:
         changelog = issue.get("changelog", {})
         histories = changelog.get("histories", [])
 
-        created_str = issue["fields"].get("created")
-        current_status = issue["fields"].get("status", {}).get("name", "Unknown")
-        resolution_str = issue["fields"].get("resolutiondate")
+        fields = issue["fields"]
+        current_status = fields.get("status", {}).get("name", "Unknown")
 
-        if not created_str:
-            return {}
-
-        try:
-            created_date = datetime.strptime(created_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-        except ValueError:
-            try:
-                created_date = datetime.strptime(created_str, "%Y-%m-%dT%H:%M:%S%z")
-            except ValueError:
+        if created_date is None:
+            created_date = parse_datetime(fields.get("created"))
+            if not created_date:
                 return {}
 
-        # Build status transition history
+        # Build status transition history as (date, from, to) tuples
         status_transitions = []
+        add_transition = status_transitions.append
 
         for history in histories:
             history_created = history.get("created")
             if not history_created:
                 continue
 
-            try:
-                transition_date = datetime.strptime(history_created, "%Y-%m-%dT%H:%M:%S.%f%z")
-            except ValueError:
-                try:
-                    transition_date = datetime.strptime(history_created, "%Y-%m-%dT%H:%M:%S%z")
-                except ValueError:
-                    continue
-
-            for item in history.get("items", []):
+            transition_date = parse_datetime(history_created)
+            if not transition_date:
+                continue
+
+            for item in history.get("items", ()):
                 if item.get("field") == "status":
-                    from_status = item.get("fromString")
-                    to_status = item.get("toString")
-                    status_transitions.append(
-                        {"date": transition_date, "from": from_status, "to": to_status}
-                    )
+                    add_transition((transition_date, item.get("fromString"), item.get("toString")))
 
-        status_transitions.sort(key=lambda x: x["date"])
+        status_transitions.sort(key=itemgetter(0))
 
         # Determine initial status
         if status_transitions:
-            initial_status = status_transitions[0]["from"]
+            initial_status = status_transitions[0][1]
         else:
             initial_status = current_status
 
-        # Calculate time spent in each state
+        # Calculate time spent in each state, holding a reference to the current state's
+        # stats dict so each transition costs one dict lookup instead of four
         current_state = initial_status
         current_state_start = created_date
+        current_stats = None
 
         if current_state:
-            if current_state not in state_stats:
-                state_stats[current_state] = {"total_seconds": 0, "count": 0}
-            state_stats[current_state]["count"] += 1
+            current_stats = state_stats[current_state] = {"total_seconds": 0, "count": 1}
 
-        for transition in status_transitions:
+        for transition_date, _, next_state in status_transitions:
             if current_state:
-                duration = (transition["date"] - current_state_start).total_seconds()
-                state_stats[current_state]["total_seconds"] += duration
+                current_stats["total_seconds"] += (
+                    transition_date - current_state_start
+                ).total_seconds()
 
-            current_state = transition["to"]
-            current_state_start = transition["date"]
+            current_state = next_state
+            current_state_start = transition_date
 
-            if current_state not in state_stats:
-                state_stats[current_state] = {"total_seconds": 0, "count": 0}
-            state_stats[current_state]["count"] += 1
+            current_stats = state_stats.get(current_state)
+            if current_stats is None:
+                current_stats = state_stats[current_state] = {"total_seconds": 0, "count": 0}
+            current_stats["count"] += 1
 
         # Calculate time for last state
         if current_state:
-            if resolution_str:
-                try:
-                    end_date = datetime.strptime(resolution_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-                except ValueError:
-                    try:
-                        end_date = datetime.strptime(resolution_str, "%Y-%m-%dT%H:%M:%S%z")
-                    except ValueError:
-                        end_date = datetime.now(current_state_start.tzinfo)
-            else:
-                end_date = datetime.now(current_state_start.tzinfo)
+            if end_date is None:
+                end_date = parse_datetime(fields.get("resolutiondate"))
+            if not end_date:
+                end_date = now or datetime.now(current_state_start.tzinfo)
 
-            duration = (end_date - current_state_start).total_seconds()
-            state_stats[current_state]["total_seconds"] += duration
+            current_stats["total_seconds"] += (end_date - current_state_start).total_seconds()
 
         return state_stats
 
@@ -199,22 +288,7 @@ class JiraMetricsCalculator:
         Returns:
             JQL time expression (e.g., "-300d")
         """
-        if not date_str:
-            return None
-
-        try:
-            input_date = datetime.strptime(date_str, "%Y-%m-%d")
-            today = datetime.now()
-            days_diff = (today - input_date).days
-
-            if days_diff == 0:
-                return "startOfDay()"
-            elif days_diff > 0:
-                return f'"-{days_diff}d"'
-            else:
-                return f'"{abs(days_diff)}d"'
-        except ValueError:
-            return f'"{date_str}"'
+        return convert_date_to_jql(date_str)
 
     def build_jql_query(
         self,
@@ -254,10 +328,9 @@ class JiraMetricsCalculator:
                 team_members = load_team_members_from_yaml(Path(team_members_file))
 
                 if team_members:
-                    assignee_conditions = " OR ".join(
-                        [f'assignee = "{member}"' for member in team_members]
-                    )
-                    jql_parts.append(f"({assignee_conditions})")
+                    # One "in" clause keeps the query (and request URL) short for big teams
+                    quoted_members = ", ".join(f'"{member}"' for member in team_members)
+                    jql_parts.append(f"assignee in ({quoted_members})")
                     print(f"Limiting to team members from config: {len(team_members)} members")
                     print(f"Team members: {', '.join(team_members)}")
                 else:
@@ -268,12 +341,12 @@ class JiraMetricsCalculator:
         # Add date filters
         if start_date or end_date:
             if start_date:
-                start_jql = self.convert_date_to_jql(start_date)
+                start_jql = convert_date_to_jql(start_date)
                 jql_parts.append(f"resolved >= {start_jql}")
                 print(f"Start date {start_date} converted to: {start_jql}")
 
             if end_date:
-                end_jql = self.convert_date_to_jql(end_date)
+                end_jql = convert_date_to_jql(end_date)
                 jql_parts.append(f"resolved <= {end_jql}")
                 print(f"End date {end_date} converted to: {end_jql}")
         else:
@@ -283,7 +356,7 @@ class JiraMetricsCalculator:
 
         return " AND ".join(jql_parts), team_members
 
-    def fetch_all_issues(self, jql_query, batch_size=50):
+    def fetch_all_issues(self, jql_query, batch_size=DEFAULT_BATCH_SIZE):
         """
         Fetch all issues matching JQL query with pagination.
 
@@ -294,6 +367,22 @@ class JiraMetricsCalculator:
         Returns:
             List of all issues with changelog data
         """
+        return list(self.iter_issues(jql_query, batch_size=batch_size))
+
+    def iter_issues(self, jql_query, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Yield all issues matching JQL query, page by page as they are downloaded.
+
+        Unlike fetch_all_issues, at most a few pages are held in memory at once, and
+        callers can process one page while later ones are still being fetched.
+
+        Args:
+            jql_query: JQL query string
+            batch_size: Results per page
+
+        Yields:
+            Issues with changelog data, in query order
+        """
         # Get total count
         initial_data = self.fetch_jira_data(jql_query, max_results=1)
         total_issues = initial_data.get("total", 0) if initial_data else 0
@@ -301,54 +390,108 @@ class JiraMetricsCalculator:
         print(f"Total issues found for analysis: {total_issues}")
 
         if total_issues == 0:
-            return []
+            return
 
-        all_issues = []
-        for start_at in range(0, total_issues, batch_size):
-            print(f"Fetching issues {start_at} to {min(start_at + batch_size, total_issues)}...")
-            data = self.fetch_jira_data(
-                jql_query, start_at=start_at, max_results=batch_size, expand="changelog"
-            )
+        for start_at, data in self._fetch_pages(jql_query, total_issues, batch_size):
             if data and "issues" in data:
-                all_issues.extend(data["issues"])
+                yield from data["issues"]
             else:
                 print(f"Failed to fetch batch starting at {start_at}")
-                break
+                return
+
+    def _fetch_pages(self, jql_query, total, batch_size, expand="changelog", fields=_ISSUE_FIELDS):
+        """
+        Fetch every page of a query concurrently, yielding pages in order.
+
+        The first page is fetched on its own so that, if the server caps maxResults below
+        batch_size, the remaining offsets are computed from the page size it actually honours.
+        After that, up to _MAX_FETCH_WORKERS pages are in flight ahead of the consumer.
+
+        Args:
+            jql_query: JQL query string
+            total: Total number of matching issues (from the initial probe)
+            batch_size: Results per page
+            expand: Fields to expand
+            fields: Comma-separated issue fields to return
+
+        Yields:
+            (start_at, data) tuples in page order; data is None for failed pages
+        """
+
+        def fetch_page(start_at):
+            print(f"Fetching issues {start_at} to {min(start_at + batch_size, total)}...")
+            return self.fetch_jira_data(
+                jql_query,
+                start_at=start_at,
+                max_results=batch_size,
+                expand=expand,
+                fields=fields,
+            )
 
-        return all_issues
+        first_page = fetch_page(0)
+        yield 0, first_page
+        if not first_page or "issues" not in first_page:
+            return
+
+        # Only the echoed maxResults says the server capped the page; a short first page on
+        # its own just means the results ran out
+        page_size = first_page.get("maxResults")
+        if page_size and page_size < batch_size:
+            print(f"Server capped page size at {page_size} (requested {batch_size})")
+            batch_size = page_size
+
+        offsets = range(batch_size, total, batch_size)
+        if not offsets:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(offsets))) as executor:
+            pending = deque()
+            for start_at in offsets:
+                pending.append((start_at, executor.submit(fetch_page, start_at)))
+                if len(pending) >= _MAX_FETCH_WORKERS:
+                    page_start, future = pending.popleft()
+                    yield page_start, future.result()
+            while pending:
+                page_start, future = pending.popleft()
+                yield page_start, future.result()
 
     def calculate_metrics(self, issues):
         """
         Calculate comprehensive metrics from issues.
 
         Args:
-            issues: List of Jira issues
+            issues: Iterable of Jira issues (a list, or the iter_issues generator)
 
         Returns:
             Dictionary containing all calculated metrics
         """
-        if not issues:
-            return self._empty_metrics()
-
-        closing_times = []
+        # Packed doubles: 8 bytes per closure time instead of a boxed float each
+        closing_times = array("d")
         created_dates = []
         resolution_dates = []
-        issue_types = {}
+        issue_types = Counter()
+        all_states_aggregated = {}
+        total_issues = 0
+
+        # Unresolved issues all run up to the same instant
+        now = datetime.now(timezone.utc)
 
-        # Calculate basic metrics
+        # Single pass: overview fields, closure time and state durations per issue, sharing
+        # the parsed created/resolution dates between them
         for issue in issues:
+            total_issues += 1
+            created_date = resolution_date = None
             try:
-                created_str = issue["fields"].get("created")
-                resolution_str = issue["fields"].get("resolutiondate")
-                issue_type = issue["fields"].get("issuetype", {}).get("name", "Unknown")
+                fields = issue["fields"]
+                created_str = fields.get("created")
+                resolution_str = fields.get("resolutiondate")
+                issue_type = fields.get("issuetype", {}).get("name", "Unknown")
 
-                if issue_type not in issue_types:
-                    issue_types[issue_type] = 0
                 issue_types[issue_type] += 1
 
                 if created_str and resolution_str:
-                    created_date = datetime.strptime(created_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-                    resolution_date = datetime.strptime(resolution_str, "%Y-%m-%dT%H:%M:%S.%f%z")
+                    created_date = datetime.fromisoformat(created_str)
+                    resolution_date = datetime.fromisoformat(resolution_str)
 
                     created_dates.append(created_date)
                     resolution_dates.append(resolution_date)
@@ -358,24 +501,27 @@ class JiraMetricsCalculator:
             except Exception as e:
                 print(f"Error processing issue {issue.get('key', 'unknown')}: {e}")
 
-        # Calculate state durations
-        all_states_aggregated = {}
-        for issue in issues:
-            state_stats = self.calculate_state_durations(issue)
+            state_stats = self.calculate_state_durations(
+                issue, created_date=created_date, end_date=resolution_date, now=now
+            )
 
             for state, stats in state_stats.items():
-                if state not in all_states_aggregated:
-                    all_states_aggregated[state] = {
+                aggregated = all_states_aggregated.get(state)
+                if aggregated is None:
+                    aggregated = all_states_aggregated[state] = {
                         "total_seconds": 0,
                         "total_count": 0,
                         "issue_count": 0,
                     }
-                all_states_aggregated[state]["total_seconds"] += stats["total_seconds"]
-                all_states_aggregated[state]["total_count"] += stats["count"]
-                all_states_aggregated[state]["issue_count"] += 1
+                aggregated["total_seconds"] += stats["total_seconds"]
+                aggregated["total_count"] += stats["count"]
+                aggregated["issue_count"] += 1
+
+        if not total_issues:
+            return self._empty_metrics()
 
         return {
-            "total_issues": len(issues),
+            "total_issues": total_issues,
             "issue_types": issue_types,
             "closing_times": closing_times,
             "created_dates": created_dates,
@@ -388,13 +534,15 @@ class JiraMetricsCalculator:
         return {
             "total_issues": 0,
             "issue_types": {},
-            "closing_times": [],
+            "closing_times": array("d"),
             "created_dates": [],
             "resolution_dates": [],
             "state_stats": {},
         }
 
-    def calculate_velocity(self, project_key, start_date=None, end_date=None, batch_size=50):
+    def calculate_velocity(
+        self, project_key, start_date=None, end_date=None, batch_size=DEFAULT_BATCH_SIZE
+    ):
         """
         Calculate velocity based on story points.
 
@@ -410,16 +558,14 @@ class JiraMetricsCalculator:
         jql_stories_parts = [f'project = "{project_key}"', "issuetype = Story"]
 
         if start_date:
-            start_jql = self.convert_date_to_jql(start_date)
-            jql_stories_parts.append(f"resolved >= {start_jql}")
+            jql_stories_parts.append(f"resolved >= {convert_date_to_jql(start_date)}")
 
         if end_date:
-            end_jql = self.convert_date_to_jql(end_date)
-            jql_stories_parts.append(f"resolved <= {end_jql}")
+            jql_stories_parts.append(f"resolved <= {convert_date_to_jql(end_date)}")
 
         jql_stories = " AND ".join(jql_stories_parts)
 
-        print(f"\n[DEBUG] Story query JQL: {jql_stories}\n")
+        logger.debug("Story query JQL: %s", jql_stories)
 
         story_data = self.fetch_jira_data(jql_stories, max_results=1)
         total_stories = story_data.get("total", 0) if story_data else 0
@@ -432,22 +578,23 @@ class JiraMetricsCalculator:
                 "avg_points_per_story": 0,
             }
 
-        all_stories = []
-        for start_at in range(0, total_stories, batch_size):
-            data = self.fetch_jira_data(
-                jql_stories, start_at=start_at, max_results=batch_size, expand="changelog"
-            )
-            if data and "issues" in data:
-                all_stories.extend(data["issues"])
-
         total_story_points = 0
         stories_with_points = 0
 
-        for story in all_stories:
-            story_points = story["fields"].get("customfield_12310243")
-            if story_points:
-                total_story_points += float(story_points)
-                stories_with_points += 1
+        # Pages are consumed as they arrive; velocity only needs story points, so skip the
+        # changelog and other fields. Unlike iter_issues, a failed page is skipped rather
+        # than ending the scan.
+        pages = self._fetch_pages(
+            jql_stories, total_stories, batch_size, expand=None, fields=_STORY_POINTS_FIELD
+        )
+        for _, data in pages:
+            if not data or "issues" not in data:
+                continue
+            for story in data["issues"]:
+                story_points = story["fields"].get(_STORY_POINTS_FIELD)
+                if story_points:
+                    total_story_points += float(story_points)
+                    stories_with_points += 1
 
         return {
             "total_stories": total_stories,
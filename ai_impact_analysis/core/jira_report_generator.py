@@ -6,17 +6,162 @@ Extracted from cli/get_jira_metrics.py and cli/generate_jira_comparison_report.p
 """
 
 import os
-import json
 import re
 from datetime import datetime
+from operator import itemgetter
 
+from ai_impact_analysis.utils.core_utils import parse_date, save_json_file
 from ai_impact_analysis.utils.report_utils import (
     normalize_username,
-    calculate_percentage_change,
     format_metric_changes,
     add_metric_change,
 )
 
+# Report files are read line by line; a larger buffer cuts read syscalls
+_READ_BUFFER_SIZE = 256 * 1024
+
+# Patterns used by parse_jira_report, compiled once at import time
+_TOTAL_RE = re.compile(r"Total:\s*(\d+)")
+_AVG_CLOSURE_RE = re.compile(r"Average Closure Time:\s*([\d.]+)\s*days")
+_MAX_CLOSURE_RE = re.compile(r"Longest Closure Time:\s*([\d.]+)\s*days")
+_LEAVE_DAYS_RE = re.compile(r"Leave Days:\s*([\d.]+)\s*days?")
+_CAPACITY_RE = re.compile(r"Capacity:\s*([\d.]+)")
+_DATA_SPAN_RE = re.compile(r"Data Span:\s*(\d+)\s*days")
+_ISSUE_TYPE_RE = re.compile(r"\s*(Story|Task|Bug|Epic|Sub-task)\s+(\d+)\s*\(\s*([\d.]+)%\)")
+_STATE_TIME_RE = re.compile(r"^(\S+(?:\s+\S+)?)\s+(\d+)\s+(\d+)\s+([-\d.]+)\s*(days|hours)")
+_REENTRY_RE = re.compile(r"([\d.]+)\s*times")
+
+_KNOWN_REENTRY_STATES = frozenset(
+    {"To Do", "In Progress", "Review", "New", "Waiting", "Release Pending"}
+)
+# "<state>:" lines in the detailed state analysis are never longer than this
+_MAX_STATE_HEADER_LENGTH = 40
+
+# Rows shown in the comparison TSV
+_COMPARISON_STATES = ("New", "To Do", "In Progress", "Review", "Release Pending", "Waiting")
+_COMPARISON_REENTRY_STATES = ("To Do", "In Progress", "Review", "Waiting")
+_COMPARISON_ISSUE_TYPES = ("Story", "Task", "Bug", "Epic")
+_THROUGHPUT_ROW_LABELS = (
+    "Daily Throughput (skip leave days)",
+    "Daily Throughput (based on capacity)",
+    "Daily Throughput (considering leave days + capacity)",
+    "Daily Throughput",
+)
+
+# Cell formatters for the comparison TSV (bound once, cheap to map over columns)
+_format_days = "{:.2f}d".format
+_format_rate = "{:.2f}x".format
+_format_throughput = "{:.2f}/d".format
+_format_percent = "{:.2f}%".format
+
+_SECONDS_PER_DAY = 24 * 3600
+
+
+def _closing_time_summary(closing_times):
+    """Return (average, shortest, longest) closure time in seconds."""
+    return sum(closing_times) / len(closing_times), min(closing_times), max(closing_times)
+
+
+def _state_statistics_entry(stats):
+    """Build the JSON state_statistics entry for one aggregated state."""
+    total_seconds = stats["total_seconds"]
+    total_count = stats["total_count"]
+    issue_count = stats["issue_count"]
+    avg_seconds = total_seconds / issue_count
+    return {
+        "total_count": total_count,
+        "issue_count": issue_count,
+        "average_seconds": avg_seconds,
+        "average_days": avg_seconds / _SECONDS_PER_DAY,
+        "average_hours": avg_seconds / 3600,
+        "total_seconds": total_seconds,
+        "avg_transitions_per_issue": total_count / issue_count,
+    }
+
+
+def _header_value(line):
+    """Return the stripped text after the first colon of a header line."""
+    return line.split(":", 1)[1].strip()
+
+
+def _parse_assignee(data, line):
+    data["assignee"] = _header_value(line)
+
+
+def _parse_jql_query(data, line):
+    data["jql_query"] = _header_value(line)
+
+
+def _parse_total(data, line):
+    match = _TOTAL_RE.search(line)
+    if match:
+        data["total_issues"] = int(match.group(1))
+
+
+def _parse_avg_closure(data, line):
+    match = _AVG_CLOSURE_RE.search(line)
+    if match:
+        data["closure_stats"]["avg_days"] = float(match.group(1))
+
+
+def _parse_max_closure(data, line):
+    match = _MAX_CLOSURE_RE.search(line)
+    if match:
+        data["closure_stats"]["max_days"] = float(match.group(1))
+
+
+def _parse_start(data, line):
+    data["time_range"]["start_date"] = _header_value(line)
+
+
+def _parse_end(data, line):
+    data["time_range"]["end_date"] = _header_value(line)
+
+
+def _parse_leave_days(data, line):
+    match = _LEAVE_DAYS_RE.search(line)
+    if match:
+        data["time_range"]["leave_days"] = float(match.group(1))
+
+
+def _parse_capacity(data, line):
+    match = _CAPACITY_RE.search(line)
+    if match:
+        data["time_range"]["capacity"] = float(match.group(1))
+
+
+def _parse_earliest_resolved(data, line):
+    data["time_range"]["earliest_resolved"] = _header_value(line)
+
+
+def _parse_latest_resolved(data, line):
+    data["time_range"]["latest_resolved"] = _header_value(line)
+
+
+def _parse_data_span(data, line):
+    match = _DATA_SPAN_RE.search(line)
+    if match:
+        data["time_range"]["span_days"] = int(match.group(1))
+
+
+# Header line prefix (text before the first colon) -> handler
+_HEADER_HANDLERS = {
+    "Assignee": _parse_assignee,
+    "JQL Query": _parse_jql_query,
+    "Total": _parse_total,
+    "Average Closure Time": _parse_avg_closure,
+    "Longest Closure Time": _parse_max_closure,
+    "Start": _parse_start,
+    "End": _parse_end,
+    "Leave Days": _parse_leave_days,
+    "Capacity": _parse_capacity,
+    "Earliest Resolved": _parse_earliest_resolved,
+    "Latest Resolved": _parse_latest_resolved,
+    "Data Span": _parse_data_span,
+}
+# One anchored alternation over every handled prefix, matched once per header line
+_HEADER_RE = re.compile("^(" + "|".join(map(re.escape, _HEADER_HANDLERS)) + "):")
+
 
 class JiraReportGenerator:
     """Generates reports from Jira metrics data."""
@@ -70,8 +215,8 @@ class JiraReportGenerator:
             report_lines.append(f"End: {end_date}")
 
             # Calculate phase days
-            phase_start = datetime.strptime(start_date, "%Y-%m-%d")
-            phase_end = datetime.strptime(end_date, "%Y-%m-%d")
+            phase_start = parse_date(start_date)
+            phase_end = parse_date(end_date)
             phase_days = (phase_end - phase_start).days + 1  # Inclusive
 
             # Show leave days info
@@ -100,7 +245,7 @@ class JiraReportGenerator:
 
         report_lines.append(f"Total: {total_issues} issues")
         if issue_types:
-            sorted_types = sorted(issue_types.items(), key=lambda x: x[1], reverse=True)
+            sorted_types = sorted(issue_types.items(), key=itemgetter(1), reverse=True)
             for issue_type, count in sorted_types:
                 percentage = (count / total_issues) * 100 if total_issues > 0 else 0
                 report_lines.append(f"  {issue_type:<20} {count:>5} ({percentage:>5.1f}%)")
@@ -110,11 +255,13 @@ class JiraReportGenerator:
         report_lines.append("\n--- Task Closure Time Statistics ---")
 
         if closing_times:
-            avg_closing_time_seconds = sum(closing_times) / len(closing_times)
-            avg_closing_time_days = avg_closing_time_seconds / (24 * 3600)
+            avg_closing_time_seconds, min_seconds, max_seconds = _closing_time_summary(
+                closing_times
+            )
+            avg_closing_time_days = avg_closing_time_seconds / _SECONDS_PER_DAY
             avg_closing_time_hours = avg_closing_time_seconds / 3600
-            min_time_days = min(closing_times) / (24 * 3600)
-            max_time_days = max(closing_times) / (24 * 3600)
+            min_time_days = min_seconds / _SECONDS_PER_DAY
+            max_time_days = max_seconds / _SECONDS_PER_DAY
 
             report_lines.append(f"Successfully analyzed issues: {len(closing_times)}")
             report_lines.append(
@@ -133,9 +280,14 @@ class JiraReportGenerator:
         state_stats = metrics.get("state_stats", {})
 
         if state_stats:
+            # Every state is listed, so a full sort is needed; compute each average once
+            # and carry it alongside the stats rather than redoing it in the loop below
             sorted_states = sorted(
-                state_stats.items(),
-                key=lambda x: x[1]["total_seconds"] / x[1]["issue_count"],
+                (
+                    (state, stats, stats["total_seconds"] / stats["issue_count"])
+                    for state, stats in state_stats.items()
+                ),
+                key=itemgetter(2),
                 reverse=True,
             )
 
@@ -145,8 +297,7 @@ class JiraReportGenerator:
             )
             report_lines.append("=" * 100)
 
-            for state, stats in sorted_states:
-                avg_seconds = stats["total_seconds"] / stats["issue_count"]
+            for state, stats, avg_seconds in sorted_states:
                 avg_days = avg_seconds / (24 * 3600)
                 avg_hours = avg_seconds / 3600
                 total_days = stats["total_seconds"] / (24 * 3600)
@@ -168,7 +319,7 @@ class JiraReportGenerator:
 
             # Detailed State Analysis
             report_lines.append("\n--- Detailed State Analysis ---")
-            for state, stats in sorted_states:
+            for state, stats, _ in sorted_states:
                 avg_transitions = stats["total_count"] / stats["issue_count"]
                 report_lines.append(f"\n{state}:")
                 report_lines.append(f"  - {stats['issue_count']} issues experienced this state")
@@ -238,27 +389,21 @@ class JiraReportGenerator:
 
         # Add closing time stats
         if closing_times:
-            avg_closing_time_seconds = sum(closing_times) / len(closing_times)
+            avg_closing_time_seconds, min_seconds, max_seconds = _closing_time_summary(
+                closing_times
+            )
             output_data["closing_time_stats"] = {
-                "average_days": avg_closing_time_seconds / (24 * 3600),
+                "average_days": avg_closing_time_seconds / _SECONDS_PER_DAY,
                 "average_hours": avg_closing_time_seconds / 3600,
-                "min_days": min(closing_times) / (24 * 3600),
-                "max_days": max(closing_times) / (24 * 3600),
+                "min_days": min_seconds / _SECONDS_PER_DAY,
+                "max_days": max_seconds / _SECONDS_PER_DAY,
             }
 
         # Add state statistics
-        state_stats = metrics.get("state_stats", {})
-        for state, stats in state_stats.items():
-            avg_seconds = stats["total_seconds"] / stats["issue_count"]
-            output_data["state_statistics"][state] = {
-                "total_count": stats["total_count"],
-                "issue_count": stats["issue_count"],
-                "average_seconds": avg_seconds,
-                "average_days": avg_seconds / (24 * 3600),
-                "average_hours": avg_seconds / 3600,
-                "total_seconds": stats["total_seconds"],
-                "avg_transitions_per_issue": stats["total_count"] / stats["issue_count"],
-            }
+        output_data["state_statistics"] = {
+            state: _state_statistics_entry(stats)
+            for state, stats in metrics.get("state_stats", {}).items()
+        }
 
         return output_data
 
@@ -276,15 +421,9 @@ class JiraReportGenerator:
         """
         os.makedirs(output_dir, exist_ok=True)
 
-        if assignee:
-            username = normalize_username(assignee)
-            filename = os.path.join(
-                output_dir, f'jira_report_{username}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
-            )
-        else:
-            filename = os.path.join(
-                output_dir, f'jira_report_general_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
-            )
+        identifier = normalize_username(assignee) if assignee else "general"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = os.path.join(output_dir, f"jira_report_{identifier}_{timestamp}.txt")
 
         with open(filename, "w", encoding="utf-8") as f:
             f.write(report_text)
@@ -299,8 +438,8 @@ class JiraReportGenerator:
 
         Args:
             output_data: Data dictionary
-            start_date: Start date (YYYY-MM-DD)
-            end_date: End date (YYYY-MM-DD)
+            start_date: Start date (YYYY-MM-DD), or None for an open start
+            end_date: End date (YYYY-MM-DD), or None for an open end
             assignee: Optional assignee
             output_dir: Output directory
 
@@ -309,8 +448,9 @@ class JiraReportGenerator:
         """
         os.makedirs(output_dir, exist_ok=True)
 
-        start_formatted = start_date.replace("-", "")
-        end_formatted = end_date.replace("-", "")
+        # Open-ended ranges still get a filename instead of failing after a long fetch
+        start_formatted = (start_date or "NA").replace("-", "")
+        end_formatted = (end_date or "NA").replace("-", "")
 
         if assignee:
             identifier = normalize_username(assignee)
@@ -321,8 +461,7 @@ class JiraReportGenerator:
             output_dir, f"jira_metrics_{identifier}_{start_formatted}_{end_formatted}.json"
         )
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        save_json_file(output_data, filename)
 
         return filename
 
@@ -348,113 +487,76 @@ class JiraReportGenerator:
             "state_reentry": {},
         }
 
-        with open(filename, "r", encoding="utf-8") as f:
-            content = f.read()
-            lines = content.split("\n")
-
-        # Extract basic info
-        for line in lines:
-            if line.startswith("Assignee:"):
-                data["assignee"] = line.split(":", 1)[1].strip()
-            elif line.startswith("JQL Query:"):
-                data["jql_query"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Total:"):
-                match = re.search(r"Total:\s*(\d+)", line)
-                if match:
-                    data["total_issues"] = int(match.group(1))
-            elif line.startswith("Average Closure Time:"):
-                match = re.search(r"Average Closure Time:\s*([\d.]+)\s*days", line)
-                if match:
-                    data["closure_stats"]["avg_days"] = float(match.group(1))
-            elif line.startswith("Longest Closure Time:"):
-                match = re.search(r"Longest Closure Time:\s*([\d.]+)\s*days", line)
-                if match:
-                    data["closure_stats"]["max_days"] = float(match.group(1))
-            elif line.startswith("Start:"):
-                data["time_range"]["start_date"] = line.split(":", 1)[1].strip()
-            elif line.startswith("End:"):
-                data["time_range"]["end_date"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Leave Days:"):
-                match = re.search(r"Leave Days:\s*([\d.]+)\s*days?", line)
-                if match:
-                    data["time_range"]["leave_days"] = float(match.group(1))
-            elif line.startswith("Capacity:"):
-                match = re.search(r"Capacity:\s*([\d.]+)", line)
-                if match:
-                    data["time_range"]["capacity"] = float(match.group(1))
-            elif line.startswith("Earliest Resolved:"):
-                data["time_range"]["earliest_resolved"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Latest Resolved:"):
-                data["time_range"]["latest_resolved"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Data Span:"):
-                match = re.search(r"Data Span:\s*(\d+)\s*days", line)
-                if match:
-                    data["time_range"]["span_days"] = int(match.group(1))
-
-        # Parse issue types
+        # All header fields precede the state duration section; once it starts,
+        # header dispatch is skipped (state names like "Start:" can't clobber them)
+        in_header = True
         in_issue_types = False
-        for line in lines:
-            if line.startswith("--- Issue Type Statistics ---"):
-                in_issue_types = True
-                continue
-            if in_issue_types:
-                if line.startswith("---"):
-                    break
-                match = re.match(
-                    r"\s*(Story|Task|Bug|Epic|Sub-task)\s+(\d+)\s*\(\s*([\d.]+)%\)", line
-                )
-                if match:
-                    issue_type, count, percentage = match.groups()
-                    data["issue_types"][issue_type] = {
-                        "count": int(count),
-                        "percentage": float(percentage),
-                    }
-
-        # Parse state times
         in_state_analysis = False
-        for line in lines:
-            if "State" in line and "Occurrences" in line and "Avg Duration" in line:
-                in_state_analysis = True
-                continue
-            if in_state_analysis:
-                if line.startswith("---"):
-                    break
-                line_stripped = line.strip()
-                if (
-                    line_stripped
-                    and not line_stripped.startswith("State")
-                    and not line_stripped.startswith("=")
-                ):
-                    match = re.match(
-                        r"^(\S+(?:\s+\S+)?)\s+(\d+)\s+(\d+)\s+([-\d.]+)\s*(days|hours)",
-                        line_stripped,
-                    )
-                    if match:
-                        state_name = match.group(1).strip()
-                        avg_time = float(match.group(4))
-                        time_unit = match.group(5)
-                        avg_days = avg_time / 24.0 if time_unit == "hours" else avg_time
-                        if avg_days > 0:
-                            data["state_times"][state_name] = avg_days
-
-        # Parse re-entry rates
         current_state = None
-        for line in lines:
-            if line.strip().endswith(":") and not line.startswith("-"):
-                state_candidate = line.strip().rstrip(":")
-                if state_candidate in [
-                    "To Do",
-                    "In Progress",
-                    "Review",
-                    "New",
-                    "Waiting",
-                    "Release Pending",
-                ]:
-                    current_state = state_candidate
-            elif current_state and "Average times per issue entering this state" in line:
-                match = re.search(r"([\d.]+)\s*times", line)
-                if match:
-                    data["state_reentry"][current_state] = float(match.group(1))
+
+        with open(filename, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
+            for line in f:
+                line = line.rstrip("\n")
+
+                # Header fields ("Key: value")
+                if in_header:
+                    if line.startswith("--- State Duration Analysis ---"):
+                        in_header = False
+                    else:
+                        match = _HEADER_RE.match(line)
+                        if match:
+                            _HEADER_HANDLERS[match.group(1)](data, line)
+
+                # Issue type section
+                if line.startswith("--- Issue Type Statistics ---"):
+                    in_issue_types = True
+                elif in_issue_types:
+                    if line.startswith("---"):
+                        in_issue_types = False
+                    else:
+                        match = _ISSUE_TYPE_RE.match(line)
+                        if match:
+                            issue_type, count, percentage = match.groups()
+                            data["issue_types"][issue_type] = {
+                                "count": int(count),
+                                "percentage": float(percentage),
+                            }
+
+                # State duration table
+                if "State" in line and "Occurrences" in line and "Avg Duration" in line:
+                    in_state_analysis = True
+                elif in_state_analysis:
+                    if line.startswith("---"):
+                        in_state_analysis = False
+                    elif "days" in line or "hours" in line:
+                        # Only rows carrying a duration can match the state-time pattern
+                        line_stripped = line.strip()
+                        if not line_stripped.startswith(("State", "=")):
+                            match = _STATE_TIME_RE.match(line_stripped)
+                            if match:
+                                state_name = match.group(1).strip()
+                                avg_time = float(match.group(4))
+                                time_unit = match.group(5)
+                                avg_days = avg_time / 24.0 if time_unit == "hours" else avg_time
+                                if avg_days > 0:
+                                    data["state_times"][state_name] = avg_days
+
+                # Re-entry rates from the detailed state analysis
+                if current_state and "Average times per issue entering this state" in line:
+                    match = _REENTRY_RE.search(line)
+                    if match:
+                        data["state_reentry"][current_state] = float(match.group(1))
+                elif (
+                    len(line) <= _MAX_STATE_HEADER_LENGTH
+                    and ":" in line
+                    and not line.startswith("-")
+                ):
+                    # Cheap checks first so long lines never pay for strip()
+                    state_candidate = line.strip()
+                    if state_candidate.endswith(":"):
+                        state_candidate = state_candidate.rstrip(":")
+                        if state_candidate in _KNOWN_REENTRY_STATES:
+                            current_state = state_candidate
 
         return data
 
@@ -471,174 +573,157 @@ class JiraReportGenerator:
         Returns:
             TSV format string
         """
-        lines = []
+        return "\n".join(self.iter_comparison_rows(reports, phase_names, assignee, phase_configs))
+
+    def iter_comparison_rows(self, reports, phase_names, assignee=None, phase_configs=None):
+        """
+        Yield the lines of the TSV comparison report one at a time.
+
+        Args:
+            reports: List of parsed report dictionaries
+            phase_names: List of phase names
+            assignee: Optional assignee
+            phase_configs: Optional list of (name, start_date, end_date) tuples from config
+
+        Yields:
+            TSV lines without trailing newlines
+        """
+        generated_on = datetime.now().strftime("%B %d, %Y")
 
         # Header
         if assignee:
-            lines.append(f"AI Impact Analysis Report - {assignee}")
+            yield f"AI Impact Analysis Report - {assignee}"
         else:
-            lines.append("AI Impact Analysis Report - Team Overall")
-        lines.append(f"Report Generated: {datetime.now().strftime('%B %d, %Y')}")
-        lines.append("Project: Konflux UI")
-        lines.append("")
+            yield "AI Impact Analysis Report - Team Overall"
+        yield f"Report Generated: {generated_on}"
+        yield "Project: Konflux UI"
+        yield ""
 
         # Add description for multi-phase analysis
         if len(reports) >= 2:
-            lines.append(
-                "This report analyzes development data across multiple periods to evaluate"
-            )
-            lines.append("the impact of AI tools on team efficiency:")
-            lines.append("")
+            yield "This report analyzes development data across multiple periods to evaluate"
+            yield "the impact of AI tools on team efficiency:"
+            yield ""
 
         # Phase info with date ranges
-        for i, (name, report) in enumerate(zip(phase_names, reports), 1):
-            start_date = report["time_range"].get("start_date", "N/A")
-            end_date = report["time_range"].get("end_date", "N/A")
-            lines.append(f"Phase {i}: {name} ({start_date} to {end_date})")
-        lines.append("")
+        yield from [
+            f"Phase {i}: {name} ({time_range.get('start_date', 'N/A')} to "
+            f"{time_range.get('end_date', 'N/A')})"
+            for i, (name, time_range) in enumerate(
+                zip(phase_names, (r["time_range"] for r in reports)), 1
+            )
+        ]
+        yield ""
 
         # Metrics table header
         header = "Metric\t" + "\t".join(phase_names)
-        lines.append(header)
+        yield header
 
         # Period duration (always use Data Span from individual reports)
-        periods = []
-        for r in reports:
-            span_days = r["time_range"].get("span_days")
-            if span_days is not None:
-                periods.append(f"{span_days}d")
-            else:
-                periods.append("N/A")
-        lines.append("Analysis Period\t" + "\t".join(periods))
+        span_days_list = [r["time_range"].get("span_days") for r in reports]
+        periods = [f"{d}d" if d is not None else "N/A" for d in span_days_list]
+        yield "Analysis Period\t" + "\t".join(periods)
 
         # Leave days
-        leave_days_list = []
-        for r in reports:
-            leave_days = r["time_range"].get("leave_days", 0)
-            # Format as int if it's a whole number, otherwise as float
-            if isinstance(leave_days, float) and leave_days == int(leave_days):
-                leave_days_list.append(str(int(leave_days)))
-            else:
-                leave_days_list.append(str(leave_days))
-        lines.append("Leave Days\t" + "\t".join(leave_days_list))
+        # Format as int if it's a whole number, otherwise as float
+        leave_days_list = [
+            (
+                str(int(leave_days))
+                if isinstance(leave_days, float) and leave_days == int(leave_days)
+                else str(leave_days)
+            )
+            for leave_days in (r["time_range"].get("leave_days", 0) for r in reports)
+        ]
+        yield "Leave Days\t" + "\t".join(leave_days_list)
 
         # Capacity
-        capacity_list = []
-        for r in reports:
-            capacity = r["time_range"].get("capacity", 1.0)
-            capacity_list.append(str(capacity))
-        lines.append("Capacity\t" + "\t".join(capacity_list))
+        capacity_list = [str(r["time_range"].get("capacity", 1.0)) for r in reports]
+        yield "Capacity\t" + "\t".join(capacity_list)
 
         # Total issues
         issues = [str(r["total_issues"]) for r in reports]
-        lines.append("Total Issues Completed\t" + "\t".join(issues))
+        yield "Total Issues Completed\t" + "\t".join(issues)
 
         # Average closure time
         avg_times = [r["closure_stats"].get("avg_days", 0) for r in reports]
-        lines.append("Average Closure Time\t" + "\t".join(f"{t:.2f}d" for t in avg_times))
+        yield "Average Closure Time\t" + "\t".join(map(_format_days, avg_times))
 
         # Longest closure time
         max_times = [r["closure_stats"].get("max_days", 0) for r in reports]
-        lines.append("Longest Closure Time\t" + "\t".join(f"{t:.2f}d" for t in max_times))
-
-        # Daily throughput (skip leave days) = Total Issues / (Analysis Period - Leave Days)
-        throughputs_skip_leave = []
-        for i, report in enumerate(reports):
-            period = periods[i]
-            if period != "N/A" and period.endswith("d"):
-                analysis_days = int(period.replace("d", ""))
-                leave_days = report["time_range"].get("leave_days", 0)
-                effective_days = analysis_days - leave_days
-                throughput = report["total_issues"] / effective_days if effective_days > 0 else 0
-                throughputs_skip_leave.append(f"{throughput:.2f}/d")
-            else:
-                throughputs_skip_leave.append("N/A")
-        lines.append("Daily Throughput (skip leave days)\t" + "\t".join(throughputs_skip_leave))
-
-        # Daily throughput (based on capacity) = Total Issues / (Analysis Period × Capacity)
-        throughputs_capacity = []
-        for i, report in enumerate(reports):
-            period = periods[i]
-            if period != "N/A" and period.endswith("d"):
-                analysis_days = int(period.replace("d", ""))
-                capacity = report["time_range"].get("capacity", 1.0)
-                effective_days = analysis_days * capacity
-                throughput = report["total_issues"] / effective_days if effective_days > 0 else 0
-                throughputs_capacity.append(f"{throughput:.2f}/d")
-            else:
-                throughputs_capacity.append("N/A")
-        lines.append("Daily Throughput (based on capacity)\t" + "\t".join(throughputs_capacity))
+        yield "Longest Closure Time\t" + "\t".join(map(_format_days, max_times))
+
+        # Daily throughputs, kept numeric (None when the period is unknown) until formatted:
+        #   skip leave days:  Total Issues / (Analysis Period - Leave Days)
+        #   based on capacity: Total Issues / (Analysis Period × Capacity)
+        #   leave + capacity: Total Issues / ((Analysis Period - Leave Days) × Capacity)
+        #   plain:            Total Issues / Analysis Period
+        throughput_columns = ([], [], [], [])
+        for report, span_days in zip(reports, span_days_list):
+            if span_days is None:
+                for column in throughput_columns:
+                    column.append(None)
+                continue
+            analysis_days = int(span_days)
+            leave_days = report["time_range"].get("leave_days", 0)
+            capacity = report["time_range"].get("capacity", 1.0)
+            total_issues = report["total_issues"]
+            effective_days_list = (
+                analysis_days - leave_days,
+                analysis_days * capacity,
+                (analysis_days - leave_days) * capacity,
+                analysis_days,
+            )
+            for column, effective_days in zip(throughput_columns, effective_days_list):
+                column.append(total_issues / effective_days if effective_days > 0 else 0)
 
-        # Daily throughput (considering leave days + capacity) = Total Issues / ((Analysis Period - Leave Days) × Capacity)
-        throughputs_both = []
-        for i, report in enumerate(reports):
-            period = periods[i]
-            if period != "N/A" and period.endswith("d"):
-                analysis_days = int(period.replace("d", ""))
-                leave_days = report["time_range"].get("leave_days", 0)
-                capacity = report["time_range"].get("capacity", 1.0)
-                effective_days = (analysis_days - leave_days) * capacity
-                throughput = report["total_issues"] / effective_days if effective_days > 0 else 0
-                throughputs_both.append(f"{throughput:.2f}/d")
-            else:
-                throughputs_both.append("N/A")
-        lines.append(
-            "Daily Throughput (considering leave days + capacity)\t" + "\t".join(throughputs_both)
-        )
+        for label, column in zip(_THROUGHPUT_ROW_LABELS, throughput_columns):
+            values = [_format_throughput(t) if t is not None else "N/A" for t in column]
+            yield f"{label}\t" + "\t".join(values)
 
-        # Daily throughput = Total Issues / Analysis Period
-        throughputs = []
+        # Per-state values for every report, gathered in one sweep over the reports and
+        # shared by the table rows and the Key Changes section
+        state_matrix = {state: [0] * len(reports) for state in _COMPARISON_STATES}
+        reentry_matrix = {state: [0] * len(reports) for state in _COMPARISON_REENTRY_STATES}
         for i, report in enumerate(reports):
-            period = periods[i]
-            if period != "N/A" and period.endswith("d"):
-                analysis_days = int(period.replace("d", ""))
-                throughput = report["total_issues"] / analysis_days if analysis_days > 0 else 0
-                throughputs.append(f"{throughput:.2f}/d")
-            else:
-                throughputs.append("N/A")
-        lines.append("Daily Throughput\t" + "\t".join(throughputs))
+            state_times = report["state_times"]
+            for state, column in state_matrix.items():
+                column[i] = state_times.get(state, 0)
+            state_reentry = report["state_reentry"]
+            for state, column in reentry_matrix.items():
+                column[i] = state_reentry.get(state, 0)
 
         # State times
-        state_names = ["New", "To Do", "In Progress", "Review", "Release Pending", "Waiting"]
-        for state in state_names:
-            values = []
-            for report in reports:
-                time = report["state_times"].get(state, 0)
-                values.append(f"{time:.2f}d" if time > 0 else "N/A")
-            lines.append(f"{state} State Avg Time\t" + "\t".join(values))
+        for state, times in state_matrix.items():
+            values = [_format_days(time) if time > 0 else "N/A" for time in times]
+            yield f"{state} State Avg Time\t" + "\t".join(values)
 
         # Re-entry rates
-        reentry_states = ["To Do", "In Progress", "Review", "Waiting"]
-        for state in reentry_states:
-            values = []
-            for report in reports:
-                rate = report["state_reentry"].get(state, 0)
-                values.append(f"{rate:.2f}x" if rate > 0 else "N/A")
-            lines.append(f"{state} Re-entry Rate\t" + "\t".join(values))
+        for state, rates in reentry_matrix.items():
+            values = [_format_rate(rate) if rate > 0 else "N/A" for rate in rates]
+            yield f"{state} Re-entry Rate\t" + "\t".join(values)
 
         # Issue types
-        issue_types = ["Story", "Task", "Bug", "Epic"]
-        for itype in issue_types:
-            values = []
-            for report in reports:
-                if itype in report["issue_types"]:
-                    values.append(f"{report['issue_types'][itype]['percentage']:.2f}%")
-                else:
-                    values.append("0.00%")
-            lines.append(f"{itype} Percentage\t" + "\t".join(values))
+        for itype in _COMPARISON_ISSUE_TYPES:
+            values = [
+                (
+                    _format_percent(report["issue_types"][itype]["percentage"])
+                    if itype in report["issue_types"]
+                    else "0.00%"
+                )
+                for report in reports
+            ]
+            yield f"{itype} Percentage\t" + "\t".join(values)
 
-        lines.append("")
-        lines.append(
-            "Note: N/A values indicate no issues entered that workflow state during the period."
-        )
-        lines.append(
+        yield ""
+        yield "Note: N/A values indicate no issues entered that workflow state during the period."
+        yield (
             "This can be positive (e.g., no blocked issues) or indicate the state isn't used in your workflow."
         )
 
         # Calculate metric changes (first phase vs last phase) - only if we have 2+ reports
         if len(reports) >= 2:
-            lines.append("")
-            lines.append("Key Changes:")
+            yield ""
+            yield "Key Changes:"
 
             first_report = reports[0]
             last_report = reports[-1]
@@ -652,25 +737,19 @@ class JiraReportGenerator:
             add_metric_change(metric_changes, "Average Closure Time", first_avg, last_avg, "d")
 
             # State times
-            for state in state_names:
-                first_time = first_report["state_times"].get(state, 0)
-                last_time = last_report["state_times"].get(state, 0)
-                add_metric_change(metric_changes, f"{state} State", first_time, last_time, "d")
+            for state, times in state_matrix.items():
+                add_metric_change(metric_changes, f"{state} State", times[0], times[-1], "d")
 
             # Re-entry rates
-            for state in reentry_states:
-                first_rate = first_report["state_reentry"].get(state, 0)
-                last_rate = last_report["state_reentry"].get(state, 0)
+            for state, rates in reentry_matrix.items():
                 add_metric_change(
-                    metric_changes, f"{state} Re-entry Rate", first_rate, last_rate, "x"
+                    metric_changes, f"{state} Re-entry Rate", rates[0], rates[-1], "x"
                 )
 
             # Format and append the top changes using shared utility
             formatted_changes = format_metric_changes(metric_changes, top_n=5)
-            lines.extend(formatted_changes)
-
-        lines.append("")
-        lines.append("For detailed metric explanations, see:")
-        lines.append("https://github.com/testcara/ai_impact_analysis#jira-report-metrics")
+            yield from formatted_changes
 
-        return "\n".join(lines)
+        yield ""
+        yield "For detailed metric explanations, see:"
+        yield "https://github.com/testcara/ai_impact_analysis#jira-report-metrics"
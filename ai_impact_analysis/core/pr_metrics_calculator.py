@@ -5,13 +5,61 @@ Core business logic for calculating GitHub PR metrics.
 Extracted from cli/get_pr_metrics.py
 """
 
+from array import array
 from datetime import datetime
+from statistics import fmean
+from typing import Any, Dict, List
+
+# (overall metric name, PR field it averages), in report order. The human-only fields
+# exclude bots like CodeRabbit.
+_OVERALL_METRIC_FIELDS = (
+    ("avg_time_to_merge_days", "time_to_merge_days"),
+    ("avg_time_to_first_review_hours", "time_to_first_review_hours"),
+    ("avg_changes_requested", "changes_requested_count"),
+    ("avg_commits", "total_commits"),
+    ("avg_reviewers", "reviewers_count"),
+    ("avg_human_reviewers", "human_reviewers_count"),
+    ("avg_comments", "total_comments_count"),
+    ("avg_human_substantive_comments", "human_substantive_comments_count"),
+    ("avg_additions", "additions"),
+    ("avg_deletions", "deletions"),
+    ("avg_files_changed", "changed_files"),
+)
+_OVERALL_METRIC_NAMES = tuple(name for name, _ in _OVERALL_METRIC_FIELDS)
+
+# (stats key, PR field, skip falsy values) for the AI / non-AI bucket averages. PRs with
+# no first review (None or 0 hours) are left out of that average.
+_BUCKET_METRIC_FIELDS = (
+    ("avg_time_to_merge_days", "time_to_merge_days", False),
+    ("avg_time_to_first_review_hours", "time_to_first_review_hours", True),
+    ("avg_changes_requested", "changes_requested_count", False),
+    ("avg_commits", "total_commits", False),
+    ("avg_reviewers", "reviewers_count", False),
+    ("avg_comments", "total_comments_count", False),
+    ("avg_additions", "additions", False),
+    ("avg_deletions", "deletions", False),
+    ("avg_files_changed", "changed_files", False),
+)
+
+# (comparison name, bucket average it compares) for the AI vs non-AI improvement figures
+_COMPARISON_FIELDS = (
+    ("merge_time_improvement", "avg_time_to_merge_days"),
+    ("changes_requested_reduction", "avg_changes_requested"),
+)
+
+
+def _percent_reduction(baseline_stats, ai_stats, key):
+    """Return how much lower the AI average is than the baseline, in percent (0 if no baseline)."""
+    baseline = baseline_stats.get(key, 0)
+    if baseline <= 0:
+        return 0
+    return (baseline - ai_stats.get(key, 0)) / baseline * 100
 
 
 class PRMetricsCalculator:
     """Calculator for GitHub PR metrics and statistics."""
 
-    def calculate_statistics(self, prs_with_metrics):
+    def calculate_statistics(self, prs_with_metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Calculate aggregated statistics from PR metrics.
 
@@ -22,110 +70,78 @@ class PRMetricsCalculator:
             Dictionary with aggregated statistics
         """
         if not prs_with_metrics:
-            return {"total_prs": 0, "ai_assisted_prs": 0, "non_ai_prs": 0, "ai_adoption_rate": 0}
-
-        # Separate AI and non-AI PRs
-        ai_prs = [pr for pr in prs_with_metrics if pr["has_ai_assistance"]]
-        non_ai_prs = [pr for pr in prs_with_metrics if not pr["has_ai_assistance"]]
-
-        # Count by AI tool
-        claude_prs = [pr for pr in ai_prs if "Claude" in pr["ai_tools"]]
-        cursor_prs = [pr for pr in ai_prs if "Cursor" in pr["ai_tools"]]
-        both_prs = [pr for pr in ai_prs if len(pr["ai_tools"]) > 1]
-
-        def avg(values):
-            """Calculate average, handling empty lists."""
-            return sum(values) / len(values) if values else 0
-
-        # Calculate AI metrics
-        ai_stats = {}
-        if ai_prs:
-            ai_stats = {
-                "count": len(ai_prs),
-                "avg_time_to_merge_days": avg([pr["time_to_merge_days"] for pr in ai_prs]),
-                "avg_time_to_first_review_hours": avg(
-                    [
-                        pr["time_to_first_review_hours"]
-                        for pr in ai_prs
-                        if pr["time_to_first_review_hours"]
-                    ]
-                ),
-                "avg_changes_requested": avg([pr["changes_requested_count"] for pr in ai_prs]),
-                "avg_commits": avg([pr["total_commits"] for pr in ai_prs]),
-                "avg_reviewers": avg([pr["reviewers_count"] for pr in ai_prs]),
-                "avg_comments": avg([pr["total_comments_count"] for pr in ai_prs]),
-                "avg_additions": avg([pr["additions"] for pr in ai_prs]),
-                "avg_deletions": avg([pr["deletions"] for pr in ai_prs]),
-                "avg_files_changed": avg([pr["changed_files"] for pr in ai_prs]),
+            return {
+                "total_prs": 0,
+                "ai_assisted_prs": 0,
+                "non_ai_prs": 0,
+                "ai_adoption_rate": 0,
+                "overall_stats": self.calculate_overall_metrics(prs_with_metrics),
             }
 
-        # Calculate non-AI metrics
-        non_ai_stats = {}
-        if non_ai_prs:
-            non_ai_stats = {
-                "count": len(non_ai_prs),
-                "avg_time_to_merge_days": avg([pr["time_to_merge_days"] for pr in non_ai_prs]),
-                "avg_time_to_first_review_hours": avg(
-                    [
-                        pr["time_to_first_review_hours"]
-                        for pr in non_ai_prs
-                        if pr["time_to_first_review_hours"]
-                    ]
-                ),
-                "avg_changes_requested": avg([pr["changes_requested_count"] for pr in non_ai_prs]),
-                "avg_commits": avg([pr["total_commits"] for pr in non_ai_prs]),
-                "avg_reviewers": avg([pr["reviewers_count"] for pr in non_ai_prs]),
-                "avg_comments": avg([pr["total_comments_count"] for pr in non_ai_prs]),
-                "avg_additions": avg([pr["additions"] for pr in non_ai_prs]),
-                "avg_deletions": avg([pr["deletions"] for pr in non_ai_prs]),
-                "avg_files_changed": avg([pr["changed_files"] for pr in non_ai_prs]),
-            }
+        # One pass over the PRs: route each PR's values into its bucket's packed columns
+        # (unboxed doubles for fmean) and count AI tools along the way
+        fields = [(field, skip_falsy) for _, field, skip_falsy in _BUCKET_METRIC_FIELDS]
+        ai_columns = [array("d") for _ in fields]
+        non_ai_columns = [array("d") for _ in fields]
+        ai_count = non_ai_count = 0
+        claude_count = cursor_count = both_count = 0
+
+        for pr in prs_with_metrics:
+            if pr["has_ai_assistance"]:
+                ai_count += 1
+                columns = ai_columns
+                # Each membership test runs once and feeds both its own count and "both"
+                ai_tools = pr["ai_tools"]
+                uses_claude = "Claude" in ai_tools
+                uses_cursor = "Cursor" in ai_tools
+                claude_count += uses_claude
+                cursor_count += uses_cursor
+                both_count += uses_claude and uses_cursor
+            else:
+                non_ai_count += 1
+                columns = non_ai_columns
+
+            for column, (field, skip_falsy) in zip(columns, fields):
+                value = pr[field]
+                if skip_falsy and not value:
+                    continue
+                column.append(value)
+
+        def bucket_stats(count, columns):
+            """Build a bucket's averages dict, or an empty dict if it has no PRs."""
+            if not count:
+                return {}
+            bucket = {"count": count}
+            for (name, _, _), column in zip(_BUCKET_METRIC_FIELDS, columns):
+                bucket[name] = fmean(column) if column else 0
+            return bucket
+
+        ai_stats = bucket_stats(ai_count, ai_columns)
+        non_ai_stats = bucket_stats(non_ai_count, non_ai_columns)
 
         return {
             "total_prs": len(prs_with_metrics),
-            "ai_assisted_prs": len(ai_prs),
-            "non_ai_prs": len(non_ai_prs),
-            "ai_adoption_rate": (
-                (len(ai_prs) / len(prs_with_metrics) * 100) if prs_with_metrics else 0
-            ),
+            "ai_assisted_prs": ai_count,
+            "non_ai_prs": non_ai_count,
+            "ai_adoption_rate": ai_count / len(prs_with_metrics) * 100,
             # By tool
-            "claude_prs": len(claude_prs),
-            "cursor_prs": len(cursor_prs),
-            "both_tools_prs": len(both_prs),
+            "claude_prs": claude_count,
+            "cursor_prs": cursor_count,
+            "both_tools_prs": both_count,
             # AI stats
             "ai_stats": ai_stats,
             # Non-AI stats
             "non_ai_stats": non_ai_stats,
+            # All PRs combined, for reports that do not split by AI usage
+            "overall_stats": self.calculate_overall_metrics(prs_with_metrics),
             # Comparison (improvement %)
             "comparison": {
-                "merge_time_improvement": (
-                    (
-                        (
-                            non_ai_stats.get("avg_time_to_merge_days", 0)
-                            - ai_stats.get("avg_time_to_merge_days", 0)
-                        )
-                        / non_ai_stats.get("avg_time_to_merge_days", 1)
-                        * 100
-                    )
-                    if non_ai_stats.get("avg_time_to_merge_days", 0) > 0
-                    else 0
-                ),
-                "changes_requested_reduction": (
-                    (
-                        (
-                            non_ai_stats.get("avg_changes_requested", 0)
-                            - ai_stats.get("avg_changes_requested", 0)
-                        )
-                        / non_ai_stats.get("avg_changes_requested", 1)
-                        * 100
-                    )
-                    if non_ai_stats.get("avg_changes_requested", 0) > 0
-                    else 0
-                ),
+                name: _percent_reduction(non_ai_stats, ai_stats, key)
+                for name, key in _COMPARISON_FIELDS
             },
         }
 
-    def calculate_overall_metrics(self, prs_with_metrics):
+    def calculate_overall_metrics(self, prs_with_metrics: List[Dict[str, Any]]) -> Dict[str, float]:
         """
         Calculate overall metrics combining all PRs.
 
@@ -135,66 +151,23 @@ class PRMetricsCalculator:
         Returns:
             Dictionary with overall metrics
         """
-
-        def avg(values):
-            return sum(values) / len(values) if values else 0
-
-        merge_times = [
-            pr["time_to_merge_days"]
-            for pr in prs_with_metrics
-            if pr.get("time_to_merge_days") is not None
-        ]
-        review_times = [
-            pr["time_to_first_review_hours"]
-            for pr in prs_with_metrics
-            if pr.get("time_to_first_review_hours") is not None
-        ]
-        changes = [
-            pr["changes_requested_count"]
-            for pr in prs_with_metrics
-            if pr.get("changes_requested_count") is not None
-        ]
-        commits = [
-            pr["total_commits"] for pr in prs_with_metrics if pr.get("total_commits") is not None
-        ]
-        reviewers = [
-            pr["reviewers_count"]
-            for pr in prs_with_metrics
-            if pr.get("reviewers_count") is not None
-        ]
-        comments = [
-            pr["total_comments_count"]
-            for pr in prs_with_metrics
-            if pr.get("total_comments_count") is not None
-        ]
-        additions = [pr["additions"] for pr in prs_with_metrics if pr.get("additions") is not None]
-        deletions = [pr["deletions"] for pr in prs_with_metrics if pr.get("deletions") is not None]
-        files = [
-            pr["changed_files"] for pr in prs_with_metrics if pr.get("changed_files") is not None
-        ]
-
-        # Human-only metrics (excluding bots like CodeRabbit)
-        human_reviewers = [
-            pr["human_reviewers_count"]
-            for pr in prs_with_metrics
-            if pr.get("human_reviewers_count") is not None
-        ]
-        human_substantive_comments = [
-            pr["human_substantive_comments_count"]
-            for pr in prs_with_metrics
-            if pr.get("human_substantive_comments_count") is not None
-        ]
+        if not prs_with_metrics:
+            return dict.fromkeys(_OVERALL_METRIC_NAMES, 0)
+
+        # One pass over the PRs keeping a running (sum, count) per metric, skipping
+        # missing values
+        fields = [field for _, field in _OVERALL_METRIC_FIELDS]
+        sums = [0] * len(fields)
+        counts = [0] * len(fields)
+        for pr in prs_with_metrics:
+            get = pr.get  # bound once per PR, called once per metric
+            for i, field in enumerate(fields):
+                value = get(field)
+                if value is not None:
+                    sums[i] += value
+                    counts[i] += 1
 
         return {
-            "avg_time_to_merge_days": avg(merge_times),
-            "avg_time_to_first_review_hours": avg(review_times),
-            "avg_changes_requested": avg(changes),
-            "avg_commits": avg(commits),
-            "avg_reviewers": avg(reviewers),
-            "avg_human_reviewers": avg(human_reviewers),
-            "avg_comments": avg(comments),
-            "avg_human_substantive_comments": avg(human_substantive_comments),
-            "avg_additions": avg(additions),
-            "avg_deletions": avg(deletions),
-            "avg_files_changed": avg(files),
+            name: (sums[i] / counts[i] if counts[i] else 0)
+            for i, name in enumerate(_OVERALL_METRIC_NAMES)
         }
@@ -6,18 +6,99 @@ Extracted from cli/get_pr_metrics.py
 """
 
 import os
-import json
+import hashlib
 from datetime import datetime
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
+from ai_impact_analysis.core.pr_metrics_calculator import PRMetricsCalculator
+from ai_impact_analysis.utils.core_utils import load_json_file, save_json_file
+from ai_impact_analysis.utils.logger import logger
 from ai_impact_analysis.utils.report_utils import (
     add_metric_change,
     format_metric_changes,
 )
 
+# Cell formatters for the comparison TSV (bound once, cheap to call per cell)
+_format_days = "{:.2f}d".format
+_format_hours = "{:.2f}h".format
+_format_decimal = "{:.2f}".format
+_format_whole = "{:.0f}".format
+_format_percent = "{:.1f}%".format
+
+# (label, parsed report key, cell formatter, human-only) for each comparison table row.
+# Human-only rows (excluding bots like CodeRabbit) appear only if every report has that data.
+_COMPARISON_ROWS = (
+    ("Total PRs Merged (excl. bot-authored)", "total_prs", str, False),
+    ("AI Adoption Rate", "ai_adoption_rate", _format_percent, False),
+    ("AI-Assisted PRs", "ai_assisted_prs", str, False),
+    ("Non-AI PRs", "non_ai_prs", str, False),
+    # AI tool breakdown
+    ("Claude PRs", "claude_prs", str, False),
+    ("Cursor PRs", "cursor_prs", str, False),
+    ("Avg Time to Merge per PR (days)", "avg_time_to_merge_days", _format_days, False),
+    (
+        "Avg Time to First Review per PR (hours)",
+        "avg_time_to_first_review_hours",
+        _format_hours,
+        False,
+    ),
+    ("Avg Changes Requested per PR", "avg_changes_requested", _format_decimal, False),
+    ("Avg Commits per PR", "avg_commits", _format_decimal, False),
+    ("Avg Reviewers per PR", "avg_reviewers", _format_decimal, False),
+    ("Avg Reviewers per PR (excl. bots)", "avg_human_reviewers", _format_decimal, True),
+    ("Avg Comments per PR", "avg_comments", _format_decimal, False),
+    (
+        "Avg Comments per PR (excl. bots & approvals)",
+        "avg_human_substantive_comments",
+        _format_decimal,
+        True,
+    ),
+    # Code changes - average per PR
+    ("Avg Lines Added per PR", "avg_additions", _format_whole, False),
+    ("Avg Lines Deleted per PR", "avg_deletions", _format_whole, False),
+    ("Avg Files Changed per PR", "avg_files_changed", _format_decimal, False),
+    # Code changes - totals
+    ("Total Lines Added", "total_additions", str, False),
+    ("Total Lines Deleted", "total_deletions", str, False),
+    ("Total Files Changed", "total_files_changed", str, False),
+)
+
+# (label, parsed report key, unit) for the first-vs-last phase "Key Changes" section
+_KEY_CHANGE_METRICS = (
+    ("Avg Time to Merge per PR", "avg_time_to_merge_days", "d"),
+    ("Avg Time to First Review per PR", "avg_time_to_first_review_hours", "h"),
+    ("Avg Changes Requested per PR", "avg_changes_requested", ""),
+    ("Avg Commits per PR", "avg_commits", ""),
+    ("Avg Reviewers per PR", "avg_reviewers", ""),
+    ("Avg Comments per PR", "avg_comments", ""),
+    ("Avg Lines Added per PR", "avg_additions", ""),
+    ("Avg Lines Deleted per PR", "avg_deletions", ""),
+    ("Avg Files Changed per PR", "avg_files_changed", ""),
+)
+
+# Parsed-report cache entries kept on disk; the oldest are removed beyond this
+_MAX_PARSE_CACHE_ENTRIES = 256
+
+# Part of every parsed-report cache key; bump it whenever _parse_pr_report_file's output
+# changes so summaries cached by an older version are not served
+_PARSE_CACHE_VERSION = 1
+
 
 class PRReportGenerator:
     """Generates reports from PR metrics data."""
 
+    def __init__(self, parse_cache_dir: Optional[str] = None):
+        """
+        Initialize the report generator.
+
+        Args:
+            parse_cache_dir: Optional directory for caching parsed reports across runs
+                (entries are keyed by parser version, report path, modification time and size)
+        """
+        self.parse_cache_dir = Path(parse_cache_dir) if parse_cache_dir else None
+
     def generate_text_report(
         self, stats, prs_with_metrics, start_date, end_date, repo_owner, repo_name, author=None
     ):
@@ -62,70 +143,29 @@ class PRReportGenerator:
                 lines.append(f"Both Tools: {stats['both_tools_prs']}")
             lines.append("")
 
-        # Calculate overall metrics (combining AI and non-AI PRs)
-        def avg(values):
-            return sum(values) / len(values) if values else 0
-
-        merge_times = [
-            pr["time_to_merge_days"]
-            for pr in prs_with_metrics
-            if pr.get("time_to_merge_days") is not None
-        ]
-        review_times = [
-            pr["time_to_first_review_hours"]
-            for pr in prs_with_metrics
-            if pr.get("time_to_first_review_hours") is not None
-        ]
-        changes = [
-            pr["changes_requested_count"]
-            for pr in prs_with_metrics
-            if pr.get("changes_requested_count") is not None
-        ]
-        commits = [
-            pr["total_commits"] for pr in prs_with_metrics if pr.get("total_commits") is not None
-        ]
-        reviewers = [
-            pr["reviewers_count"]
-            for pr in prs_with_metrics
-            if pr.get("reviewers_count") is not None
-        ]
-        comments = [
-            pr["total_comments_count"]
-            for pr in prs_with_metrics
-            if pr.get("total_comments_count") is not None
-        ]
-        additions = [pr["additions"] for pr in prs_with_metrics if pr.get("additions") is not None]
-        deletions = [pr["deletions"] for pr in prs_with_metrics if pr.get("deletions") is not None]
-        files = [
-            pr["changed_files"] for pr in prs_with_metrics if pr.get("changed_files") is not None
-        ]
-
-        # Human-only metrics (excluding bots like CodeRabbit)
-        human_reviewers = [
-            pr["human_reviewers_count"]
-            for pr in prs_with_metrics
-            if pr.get("human_reviewers_count") is not None
-        ]
-        human_substantive_comments = [
-            pr["human_substantive_comments_count"]
-            for pr in prs_with_metrics
-            if pr.get("human_substantive_comments_count") is not None
-        ]
+        # Overall metrics (combining AI and non-AI PRs), as already aggregated by
+        # calculate_statistics; computed here only for stats from older callers
+        overall = stats.get("overall_stats")
+        if overall is None:
+            overall = PRMetricsCalculator().calculate_overall_metrics(prs_with_metrics)
 
         lines.append("--- Overall Metrics ---")
-        lines.append(f"Avg Time to Merge: {avg(merge_times):.2f} days")
-        lines.append(f"Avg Time to First Review: {avg(review_times):.2f} hours")
-        lines.append(f"Avg Changes Requested: {avg(changes):.2f}")
-        lines.append(f"Avg Commits per PR: {avg(commits):.2f}")
-        lines.append(f"Avg Reviewers: {avg(reviewers):.2f}")
-        lines.append(f"Avg Reviewers (excl. bots): {avg(human_reviewers):.2f}")
-        lines.append(f"Avg Comments: {avg(comments):.2f}")
+        lines.append(f"Avg Time to Merge: {overall['avg_time_to_merge_days']:.2f} days")
+        lines.append(
+            f"Avg Time to First Review: {overall['avg_time_to_first_review_hours']:.2f} hours"
+        )
+        lines.append(f"Avg Changes Requested: {overall['avg_changes_requested']:.2f}")
+        lines.append(f"Avg Commits per PR: {overall['avg_commits']:.2f}")
+        lines.append(f"Avg Reviewers: {overall['avg_reviewers']:.2f}")
+        lines.append(f"Avg Reviewers (excl. bots): {overall['avg_human_reviewers']:.2f}")
+        lines.append(f"Avg Comments: {overall['avg_comments']:.2f}")
         lines.append(
-            f"Avg Comments (excl. bots & approvals): {avg(human_substantive_comments):.2f}"
+            "Avg Comments (excl. bots & approvals): "
+            f"{overall['avg_human_substantive_comments']:.2f}"
         )
-        lines.append(f"Avg Lines Added: {avg(additions):.2f}")
-        lines.append(f"Avg Lines Deleted: {avg(deletions):.2f}")
-        lines.append(f"Avg Files Changed: {avg(files):.2f}")
+        lines.append(f"Avg Lines Added: {overall['avg_additions']:.2f}")
+        lines.append(f"Avg Lines Deleted: {overall['avg_deletions']:.2f}")
+        lines.append(f"Avg Files Changed: {overall['avg_files_changed']:.2f}")
         lines.append("")
         lines.append("=" * 80)
 
@@ -183,8 +223,7 @@ class PRReportGenerator:
         else:
             filename = f"{output_dir}/pr_metrics_general_{date_range}.json"
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        save_json_file(output_data, filename)
 
         return filename
 
@@ -218,18 +257,83 @@ class PRReportGenerator:
 
         return filename
 
-    def parse_pr_report(self, filename):
+    def _parse_cache_file(self, filename: str) -> Optional[Path]:
+        """Return the cache file for the current version of a report, if caching is on."""
+        if self.parse_cache_dir is None:
+            return None
+        stat = os.stat(filename)
+        key_parts = [
+            str(_PARSE_CACHE_VERSION),
+            os.path.abspath(filename),
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+        ]
+        cache_key = hashlib.md5("|".join(key_parts).encode()).hexdigest()
+        return self.parse_cache_dir / f"parsed_{cache_key}.json"
+
+    def _load_parsed_report(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Load a parsed report from the cache."""
+        try:
+            return load_json_file(cache_file)
+        except FileNotFoundError:
+            # Never cached, or evicted by another worker in the meantime
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load cache file {cache_file}: {e}")
+            return None
+
+    def _save_parsed_report(self, cache_file: Path, parsed: Dict[str, Any]):
+        """Save a parsed report to the cache, dropping the oldest entries beyond the limit."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            save_json_file(parsed, cache_file, indent=False)
+        except Exception as e:
+            logger.warning(f"Failed to save cache file {cache_file}: {e}")
+            return
+
+        # Reports are parsed concurrently, so other workers may delete entries between the
+        # directory listing and the stat/unlink calls below
+        entries = []
+        for entry in cache_file.parent.glob("parsed_*.json"):
+            try:
+                entries.append((entry.stat().st_mtime, entry))
+            except FileNotFoundError:
+                continue
+        entries.sort(key=itemgetter(0))
+        for _, stale in entries[:-_MAX_PARSE_CACHE_ENTRIES]:
+            try:
+                stale.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Failed to remove cache file {stale}: {e}")
+
+    def parse_pr_report(self, filename: str) -> Dict[str, Any]:
         """
         Parse a PR metrics JSON file and extract key metrics.
 
+        When a parse cache directory is configured, unchanged files are served from
+        the cache instead of being decoded again.
+
         Args:
             filename: Path to JSON report file
 
         Returns:
             Dictionary with extracted metrics
         """
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        cache_file = self._parse_cache_file(filename)
+        if cache_file is not None:
+            cached = self._load_parsed_report(cache_file)
+            if cached is not None:
+                cached["filename"] = filename
+                return cached
+
+        parsed = self._parse_pr_report_file(filename)
+        if cache_file is not None:
+            self._save_parsed_report(cache_file, parsed)
+        return parsed
+
+    def _parse_pr_report_file(self, filename: str) -> Dict[str, Any]:
+        """Read and summarize a PR metrics JSON file (uncached)."""
+        data = load_json_file(filename)
 
         stats = data.get("statistics", {})
         period = data.get("period", {})
@@ -248,11 +352,12 @@ class PRReportGenerator:
             or "avg_human_substantive_comments" in overall_stats
         )
 
-        # Calculate totals from individual PRs
-        all_prs = data.get("prs", [])
-        total_additions = sum(pr.get("additions", 0) for pr in all_prs)
-        total_deletions = sum(pr.get("deletions", 0) for pr in all_prs)
-        total_files_changed = sum(pr.get("changed_files", 0) for pr in all_prs)
+        # Calculate totals from individual PRs in a single pass
+        total_additions = total_deletions = total_files_changed = 0
+        for pr in data.get("prs", []):
+            total_additions += pr.get("additions", 0)
+            total_deletions += pr.get("deletions", 0)
+            total_files_changed += pr.get("changed_files", 0)
 
         return {
             "filename": filename,
@@ -284,7 +389,12 @@ class PRReportGenerator:
             "has_human_metrics": has_human_metrics,
         }
 
-    def generate_comparison_tsv(self, reports, phase_names, author=None):
+    def generate_comparison_tsv(
+        self,
+        reports: List[Dict[str, Any]],
+        phase_names: List[str],
+        author: Optional[str] = None,
+    ) -> str:
         """
         Generate TSV comparison report from multiple phase reports.
 
@@ -296,121 +406,67 @@ class PRReportGenerator:
         Returns:
             TSV format string
         """
-        lines = []
+        return "\n".join(self.iter_comparison_rows(reports, phase_names, author))
+
+    def iter_comparison_rows(
+        self,
+        reports: List[Dict[str, Any]],
+        phase_names: List[str],
+        author: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Yield the lines of the TSV comparison report one at a time.
 
+        Args:
+            reports: List of parsed report dictionaries
+            phase_names: List of phase names
+            author: Optional author
+
+        Yields:
+            TSV lines without trailing newlines
+        """
         # Header
         if author:
-            lines.append(f"PR AI Impact Analysis Report - {author}")
+            yield f"PR AI Impact Analysis Report - {author}"
         else:
-            lines.append("PR AI Impact Analysis Report - Team Overall")
-        lines.append(f"Report Generated: {datetime.now().strftime('%B %d, %Y')}")
-        lines.append("Repository: konflux-ci/konflux-ui")
-        lines.append("")
+            yield "PR AI Impact Analysis Report - Team Overall"
+        yield f"Report Generated: {datetime.now().strftime('%B %d, %Y')}"
+        yield "Repository: konflux-ci/konflux-ui"
+        yield ""
 
         # Add description for multi-phase analysis
         if len(reports) >= 2:
-            lines.append("This report analyzes PR data across multiple periods to evaluate")
-            lines.append("the impact of AI tools on development efficiency:")
-            lines.append("")
+            yield "This report analyzes PR data across multiple periods to evaluate"
+            yield "the impact of AI tools on development efficiency:"
+            yield ""
 
         # Phase info with date ranges
         for i, (name, report) in enumerate(zip(phase_names, reports), 1):
             period = report.get("period", {})
             start_date = period.get("start_date", "N/A")
             end_date = period.get("end_date", "N/A")
-            lines.append(f"Phase {i}: {name} ({start_date} to {end_date})")
-        lines.append("")
+            yield f"Phase {i}: {name} ({start_date} to {end_date})"
+        yield ""
 
         # Metrics table header
         header = "Metric\t" + "\t".join(phase_names)
-        lines.append(header)
-
-        # Total PRs
-        total_prs = [str(r["total_prs"]) for r in reports]
-        lines.append("Total PRs Merged (excl. bot-authored)\t" + "\t".join(total_prs))
-
-        # AI Adoption Rate
-        ai_rates = [f"{r['ai_adoption_rate']:.1f}%" for r in reports]
-        lines.append("AI Adoption Rate\t" + "\t".join(ai_rates))
-
-        # AI Assisted PRs
-        ai_prs = [str(r["ai_assisted_prs"]) for r in reports]
-        lines.append("AI-Assisted PRs\t" + "\t".join(ai_prs))
-
-        # Non-AI PRs
-        non_ai_prs = [str(r["non_ai_prs"]) for r in reports]
-        lines.append("Non-AI PRs\t" + "\t".join(non_ai_prs))
-
-        # AI Tool breakdown
-        claude_prs = [str(r.get("claude_prs", 0)) for r in reports]
-        lines.append("Claude PRs\t" + "\t".join(claude_prs))
-
-        cursor_prs = [str(r.get("cursor_prs", 0)) for r in reports]
-        lines.append("Cursor PRs\t" + "\t".join(cursor_prs))
-
-        # Time to Merge
-        merge_times = [f"{r['avg_time_to_merge_days']:.2f}d" for r in reports]
-        lines.append("Avg Time to Merge per PR (days)\t" + "\t".join(merge_times))
-
-        # Time to First Review
-        review_times = [f"{r['avg_time_to_first_review_hours']:.2f}h" for r in reports]
-        lines.append("Avg Time to First Review per PR (hours)\t" + "\t".join(review_times))
+        yield header
 
-        # Changes Requested
-        changes = [f"{r['avg_changes_requested']:.2f}" for r in reports]
-        lines.append("Avg Changes Requested per PR\t" + "\t".join(changes))
+        # Human-only rows are shown only if every report has that data; decided once
+        show_human_metrics = all(r.get("has_human_metrics", False) for r in reports)
 
-        # Commits
-        commits = [f"{r['avg_commits']:.2f}" for r in reports]
-        lines.append("Avg Commits per PR\t" + "\t".join(commits))
+        for label, key, format_cell, human_only in _COMPARISON_ROWS:
+            if human_only and not show_human_metrics:
+                continue
+            yield f"{label}\t" + "\t".join(map(format_cell, (r.get(key, 0) for r in reports)))
 
-        # Reviewers
-        reviewers = [f"{r['avg_reviewers']:.2f}" for r in reports]
-        lines.append("Avg Reviewers per PR\t" + "\t".join(reviewers))
-
-        # Human Reviewers (excluding bots) - only show if all reports have this data
-        if all(r.get("has_human_metrics", False) for r in reports):
-            human_reviewers = [f"{r['avg_human_reviewers']:.2f}" for r in reports]
-            lines.append("Avg Reviewers per PR (excl. bots)\t" + "\t".join(human_reviewers))
-
-        # Comments
-        comments = [f"{r['avg_comments']:.2f}" for r in reports]
-        lines.append("Avg Comments per PR\t" + "\t".join(comments))
-
-        # Human Substantive Comments - only show if all reports have this data
-        if all(r.get("has_human_metrics", False) for r in reports):
-            human_comments = [f"{r['avg_human_substantive_comments']:.2f}" for r in reports]
-            lines.append(
-                "Avg Comments per PR (excl. bots & approvals)\t" + "\t".join(human_comments)
-            )
-
-        # Code Changes - Average per PR
-        additions = [f"{r['avg_additions']:.0f}" for r in reports]
-        lines.append("Avg Lines Added per PR\t" + "\t".join(additions))
-
-        deletions = [f"{r['avg_deletions']:.0f}" for r in reports]
-        lines.append("Avg Lines Deleted per PR\t" + "\t".join(deletions))
-
-        files = [f"{r['avg_files_changed']:.2f}" for r in reports]
-        lines.append("Avg Files Changed per PR\t" + "\t".join(files))
-
-        # Code Changes - Totals
-        total_additions = [str(r.get("total_additions", 0)) for r in reports]
-        lines.append("Total Lines Added\t" + "\t".join(total_additions))
-
-        total_deletions = [str(r.get("total_deletions", 0)) for r in reports]
-        lines.append("Total Lines Deleted\t" + "\t".join(total_deletions))
-
-        total_files = [str(r.get("total_files_changed", 0)) for r in reports]
-        lines.append("Total Files Changed\t" + "\t".join(total_files))
-
-        lines.append("")
-        lines.append("Note: N/A values indicate insufficient data for that metric in the period.")
+        yield ""
+        yield "Note: N/A values indicate insufficient data for that metric in the period."
 
         # Calculate metric changes (first phase vs last phase) - only if we have 2+ reports
         if len(reports) >= 2:
-            lines.append("")
-            lines.append("Key Changes:")
+            yield ""
+            yield "Key Changes:"
 
             first_report = reports[0]
             last_report = reports[-1]
@@ -418,84 +474,8 @@ class PRReportGenerator:
             # Collect all metric changes using shared utility functions
             metric_changes = []
 
-            # Time to merge
-            add_metric_change(
-                metric_changes,
-                "Avg Time to Merge per PR",
-                first_report["avg_time_to_merge_days"],
-                last_report["avg_time_to_merge_days"],
-                "d",
-            )
-
-            # Time to first review
-            add_metric_change(
-                metric_changes,
-                "Avg Time to First Review per PR",
-                first_report["avg_time_to_first_review_hours"],
-                last_report["avg_time_to_first_review_hours"],
-                "h",
-            )
-
-            # Changes requested
-            add_metric_change(
-                metric_changes,
-                "Avg Changes Requested per PR",
-                first_report["avg_changes_requested"],
-                last_report["avg_changes_requested"],
-                "",
-            )
-
-            # Commits
-            add_metric_change(
-                metric_changes,
-                "Avg Commits per PR",
-                first_report["avg_commits"],
-                last_report["avg_commits"],
-                "",
-            )
-
-            # Reviewers
-            add_metric_change(
-                metric_changes,
-                "Avg Reviewers per PR",
-                first_report["avg_reviewers"],
-                last_report["avg_reviewers"],
-                "",
-            )
-
-            # Comments
-            add_metric_change(
-                metric_changes,
-                "Avg Comments per PR",
-                first_report["avg_comments"],
-                last_report["avg_comments"],
-                "",
-            )
-
-            # Code changes
-            add_metric_change(
-                metric_changes,
-                "Avg Lines Added per PR",
-                first_report["avg_additions"],
-                last_report["avg_additions"],
-                "",
-            )
-
-            add_metric_change(
-                metric_changes,
-                "Avg Lines Deleted per PR",
-                first_report["avg_deletions"],
-                last_report["avg_deletions"],
-                "",
-            )
-
-            add_metric_change(
-                metric_changes,
-                "Avg Files Changed per PR",
-                first_report["avg_files_changed"],
-                last_report["avg_files_changed"],
-                "",
-            )
+            for label, key, unit in _KEY_CHANGE_METRICS:
+                add_metric_change(metric_changes, label, first_report[key], last_report[key], unit)
 
             # AI Adoption Rate (special case - absolute change if starting from 0)
             first_ai_rate = first_report["ai_adoption_rate"]
@@ -516,10 +496,8 @@ class PRReportGenerator:
 
             # Format and append the top changes using shared utility
             formatted_changes = format_metric_changes(metric_changes, top_n=5)
-            lines.extend(formatted_changes)
+            yield from formatted_changes
 
-        lines.append("")
-        lines.append("For detailed metric explanations, see:")
-        lines.append("https://github.com/testcara/ai_impact_analysis#pr-report-metrics")
-
-        return "\n".join(lines)
+        yield ""
+        yield "For detailed metric explanations, see:"
+        yield "https://github.com/testcara/ai_impact_analysis#pr-report-metrics"
@@ -9,40 +9,46 @@ report showing metrics across multiple time periods.
 import os
 import sys
 import argparse
-from datetime import datetime
-from pathlib import Path
 
 from ai_impact_analysis.core.jira_report_generator import JiraReportGenerator
 from ai_impact_analysis.utils.report_utils import normalize_username, generate_comparison_report
 from ai_impact_analysis.utils.workflow_utils import (
     load_config_file,
     get_project_root,
-    load_team_members_from_yaml,
     resolve_member_identifier,
 )
 
+# Report filenames end with "_YYYYMMDD_HHMMSS.txt"; this slice is the timestamp
+_TIMESTAMP_SLICE = slice(-19, -4)
+
+
+def _report_timestamp(path):
+    """Sort key for report paths: the trailing timestamp only."""
+    return path[_TIMESTAMP_SLICE]
+
 
 def find_reports(assignee=None, reports_dir="reports/jira"):
-    """Find all matching Jira report files."""
+    """Find all matching Jira report files, oldest first."""
     if not os.path.exists(reports_dir):
         return []
 
-    files = []
-    for filename in os.listdir(reports_dir):
-        if not filename.startswith("jira_report_"):
-            continue
-        if not filename.endswith(".txt"):
-            continue
-
-        if assignee:
-            username = normalize_username(assignee)
-            if f"jira_report_{username}_" in filename:
-                files.append(os.path.join(reports_dir, filename))
-        else:
-            if "jira_report_general_" in filename:
-                files.append(os.path.join(reports_dir, filename))
+    if assignee:
+        marker = f"jira_report_{normalize_username(assignee)}_"
+    else:
+        marker = "jira_report_general_"
+
+    # scandir yields pre-joined paths and file types straight from the directory read
+    with os.scandir(reports_dir) as entries:
+        files = [
+            entry.path
+            for entry in entries
+            if entry.name.startswith("jira_report_")
+            and entry.name.endswith(".txt")
+            and marker in entry.name
+            and entry.is_file()
+        ]
 
-    return sorted(files)
+    return sorted(files, key=_report_timestamp)
 
 
 def main():
@@ -105,17 +111,13 @@ def main():
         print(f"Found: {', '.join(report_files)}")
         return 1
 
-    # Use all reports if <= 4, otherwise use the most recent 4
+    # Use all reports if <= 4, otherwise use the most recent 4 (already sorted oldest first)
     if len(report_files) > 4:
         print(f"Found {len(report_files)} reports, using the 4 most recent for comparison:")
-        report_files = sorted(report_files)[-4:]
-    else:
-        report_files = sorted(report_files)
+        report_files = report_files[-4:]
 
-    print(f"Analyzing {len(report_files)} reports:")
-    for i, f in enumerate(report_files, 1):
-        print(f"  Phase {i}: {f}")
-    print()
+    phase_lines = "\n".join(f"  Phase {i}: {f}" for i, f in enumerate(report_files, 1))
+    print(f"Analyzing {len(report_files)} reports:\n{phase_lines}\n")
 
     # Use phase names from config if available, otherwise use generic names
     if not phase_names or len(phase_names) < len(report_files):
@@ -17,6 +17,12 @@ from ai_impact_analysis.core.pr_report_generator import PRReportGenerator
 from ai_impact_analysis.utils.report_utils import generate_comparison_report
 from ai_impact_analysis.utils.workflow_utils import load_config_file, get_project_root
 
+_COMMENT_LINE_RE = re.compile(r"^[ \t]*#.*$", re.MULTILINE)
+# Body of GITHUB_PHASES=( ... ), up to the first closing parenthesis outside a quoted
+# entry (or end of file), so phase names may themselves contain parentheses
+_PHASES_ARRAY_RE = re.compile(r'GITHUB_PHASES=\(((?:"[^"]*"|[^")])*)')
+_PHASE_ENTRY_RE = re.compile(r'"([^"]+)"')
+
 
 def parse_phase_config(config_path="config/github_phases.conf"):
     """Parse phase configuration file."""
@@ -25,32 +31,13 @@ def parse_phase_config(config_path="config/github_phases.conf"):
         return phases
 
     with open(config_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    in_array = False
-    array_lines = []
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("#"):
-            continue
-        if "GITHUB_PHASES=(" in line and not stripped.startswith("#"):
-            in_array = True
-            array_start = line.split("GITHUB_PHASES=(", 1)[1]
-            array_lines.append(array_start)
-            if ")" in array_start:
-                break
-            continue
-        if in_array:
-            array_lines.append(line)
-            if ")" in line:
-                break
-
-    array_content = "".join(array_lines)
-    phase_pattern = r'"([^"]+)"'
-    phase_entries = re.findall(phase_pattern, array_content)
-
-    for entry in phase_entries:
+        content = _COMMENT_LINE_RE.sub("", f.read())
+
+    match = _PHASES_ARRAY_RE.search(content)
+    if not match:
+        return phases
+
+    for entry in _PHASE_ENTRY_RE.findall(match.group(1)):
         parts = entry.split("|")
         if len(parts) == 3:
             phases.append((parts[0].strip(), parts[1].strip(), parts[2].strip()))
@@ -59,23 +46,22 @@ def parse_phase_config(config_path="config/github_phases.conf"):
 
 
 def find_reports(author=None, reports_dir="reports/github"):
-    """Find all matching PR report files."""
+    """Find all matching PR report files, oldest first (names end with the period dates)."""
     if not os.path.exists(reports_dir):
         return []
 
-    files = []
-    for filename in os.listdir(reports_dir):
-        if not filename.startswith("pr_metrics_"):
-            continue
-        if not filename.endswith(".json"):
-            continue
+    marker = f"pr_metrics_{author}_" if author else "pr_metrics_general_"
 
-        if author:
-            if f"pr_metrics_{author}_" in filename:
-                files.append(os.path.join(reports_dir, filename))
-        else:
-            if "pr_metrics_general_" in filename:
-                files.append(os.path.join(reports_dir, filename))
+    # scandir yields pre-joined paths and file types straight from the directory read
+    with os.scandir(reports_dir) as entries:
+        files = [
+            entry.path
+            for entry in entries
+            if entry.name.startswith("pr_metrics_")
+            and entry.name.endswith(".json")
+            and marker in entry.name
+            and entry.is_file()
+        ]
 
     return sorted(files)
 
@@ -131,24 +117,21 @@ def main():
         print(f"Found: {', '.join(report_files)}")
         return 1
 
-    # Use all reports if <= 4, otherwise use the most recent 4
+    # Use all reports if <= 4, otherwise use the most recent 4 (already sorted oldest first)
     if len(report_files) > 4:
         print(f"Found {len(report_files)} reports, using the 4 most recent for comparison:")
-        report_files = sorted(report_files)[-4:]
-    else:
-        report_files = sorted(report_files)
+        report_files = report_files[-4:]
 
-    print(f"Analyzing {len(report_files)} reports:")
-    for i, f in enumerate(report_files, 1):
-        print(f"  Phase {i}: {f}")
-    print()
+    phase_lines = "\n".join(f"  Phase {i}: {f}" for i, f in enumerate(report_files, 1))
+    print(f"Analyzing {len(report_files)} reports:\n{phase_lines}\n")
 
     # Use phase names from config if available, otherwise use generic names
     if not phase_names or len(phase_names) < len(report_files):
         phase_names = [f"Phase {i+1}" for i in range(len(report_files))]
 
     # Generate comparison report using shared utility
-    report_gen = PRReportGenerator()
+    # Older phase reports never change, so their parsed summaries are reused across runs
+    report_gen = PRReportGenerator(parse_cache_dir=".cache/pr_reports")
 
     generate_comparison_report(
         report_files=report_files,
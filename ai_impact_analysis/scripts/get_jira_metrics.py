@@ -7,10 +7,15 @@ ai_impact_analysis.core.jira_metrics_calculator
 """
 
 import argparse
+import logging
 import sys
 
-from ai_impact_analysis.core.jira_metrics_calculator import JiraMetricsCalculator
+from ai_impact_analysis.core.jira_metrics_calculator import (
+    DEFAULT_BATCH_SIZE,
+    JiraMetricsCalculator,
+)
 from ai_impact_analysis.core.jira_report_generator import JiraReportGenerator
+from ai_impact_analysis.utils.logger import set_log_level
 
 
 def main():
@@ -49,9 +54,28 @@ def main():
         help="Work capacity for this member (0.0 to 1.0, e.g., '0.8' for 80%% time)",
         default=None,
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help=f"Issues per Jira API request (default: {DEFAULT_BATCH_SIZE})",
+        default=DEFAULT_BATCH_SIZE,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Jira instead of reusing cached API responses",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log Jira API requests and responses for debugging",
+    )
 
     args = parser.parse_args()
 
+    if args.verbose:
+        set_log_level(logging.DEBUG)
+
     # Load config if specified (will be merged with defaults)
     team_members_file = None
     if args.config:
@@ -73,6 +97,10 @@ def main():
     default_config_path = project_root / "config" / "jira_report_config.yaml"
     config_path = team_members_file if team_members_file else default_config_path
 
+    if args.batch_size < 1:
+        print(f"Error: --batch-size must be a positive integer, got '{args.batch_size}'")
+        return 1
+
     # Get leave_days from command line argument
     leave_days = 0
     if args.leave_days is not None:
@@ -92,7 +120,7 @@ def main():
             return 1
 
     # Initialize calculator and report generator
-    calculator = JiraMetricsCalculator(project_key=args.project)
+    calculator = JiraMetricsCalculator(project_key=args.project, use_cache=not args.no_cache)
     report_gen = JiraReportGenerator()
 
     # Build JQL query
@@ -107,16 +135,14 @@ def main():
 
     print(f"\nUsing JQL query: {jql_query}\n")
 
-    # Fetch all issues
-    all_issues = calculator.fetch_all_issues(jql_query)
+    # Fetch issues and calculate metrics as pages arrive
+    metrics = calculator.calculate_metrics(
+        calculator.iter_issues(jql_query, batch_size=args.batch_size)
+    )
 
-    if not all_issues:
+    if not metrics["total_issues"]:
+        # Empty metrics produce an empty report
         print("No issues found matching the criteria.")
-        # Generate empty report
-        metrics = calculator._empty_metrics()
-    else:
-        # Calculate metrics
-        metrics = calculator.calculate_metrics(all_issues)
 
     # Generate text report
     report_text = report_gen.generate_text_report(
@@ -141,7 +167,10 @@ def main():
     if args.start and args.end:
         # Calculate velocity
         velocity_stats = calculator.calculate_velocity(
-            args.project or calculator.project_key, start_date=args.start, end_date=args.end
+            args.project or calculator.project_key,
+            start_date=args.start,
+            end_date=args.end,
+            batch_size=args.batch_size,
         )
 
         print("\n--- Velocity Calculation (Based on Story Points) ---")
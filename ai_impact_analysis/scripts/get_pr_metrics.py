@@ -12,12 +12,16 @@ import argparse
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ai_impact_analysis.clients.github_client import GitHubClient
+from ai_impact_analysis.clients.github_client import DEFAULT_POOL_SIZE, GitHubClient
 from ai_impact_analysis.clients.github_client_graphql import GitHubGraphQLClient
 from ai_impact_analysis.core.pr_metrics_calculator import PRMetricsCalculator
 from ai_impact_analysis.core.pr_report_generator import PRReportGenerator
+from ai_impact_analysis.utils.core_utils import save_json_file
 from ai_impact_analysis.utils.logger import logger
 
+# How many completed PRs between progress lines while analyzing
+_PROGRESS_INTERVAL = 25
+
 
 def main():
     """Main entry point for PR metrics CLI."""
@@ -62,18 +66,24 @@ Examples:
     parser.add_argument(
         "--no-cache",
         action="store_true",
-        help="Disable caching (GraphQL only)",
+        help="Disable caching",
     )
     parser.add_argument(
         "--clear-cache",
         action="store_true",
-        help="Clear cache before fetching (GraphQL only)",
+        help="Clear cache before fetching",
     )
     parser.add_argument(
         "--incremental",
         action="store_true",
         help="Incremental mode: only fetch PRs updated since last run (GraphQL only)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help=f"Number of PRs analyzed concurrently (REST only, default: {DEFAULT_POOL_SIZE})",
+    )
 
     args = parser.parse_args()
 
@@ -85,6 +95,10 @@ Examples:
         print("Error: Dates must be in YYYY-MM-DD format")
         return 1
 
+    if args.workers < 1:
+        print("Error: --workers must be at least 1")
+        return 1
+
     print("\n📊 Collecting GitHub PR metrics...")
     print(f"Period: {args.start} to {args.end}")
     if args.author:
@@ -98,21 +112,21 @@ Examples:
         print("🔄 Using REST API (legacy mode)")
     else:
         print("⚡ Using GraphQL API (optimized mode)")
-        if not args.no_cache:
-            print("💾 Caching enabled")
         if args.incremental:
             print("📈 Incremental mode enabled")
+    if not args.no_cache:
+        print("💾 Caching enabled")
 
     # Initialize GitHub client
     try:
         if use_graphql:
             client = GitHubGraphQLClient()
-
-            if args.clear_cache:
-                print("\n🗑️  Clearing cache...")
-                client.clear_cache()
         else:
-            client = GitHubClient()
+            client = GitHubClient(pool_size=args.workers, use_cache=not args.no_cache)
+
+        if args.clear_cache:
+            print("\n🗑️  Clearing cache...")
+            client.clear_cache()
     except ValueError as e:
         print(f"\nError: {e}")
         print("\nPlease set the following environment variables:")
@@ -156,29 +170,28 @@ Examples:
                     logger.error(f"Error analyzing PR #{pr['number']}: {e}")
                     return None
 
-            max_workers = min(10, len(prs))
+            max_workers = min(args.workers, len(prs))
 
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 future_to_pr = {executor.submit(analyze_single_pr, pr): pr for pr in prs}
 
-                completed = 0
-                for future in as_completed(future_to_pr):
+                # Progress is reported every few PRs rather than once per PR; failures are
+                # logged individually
+                total = len(prs)
+                for completed, future in enumerate(as_completed(future_to_pr), 1):
                     pr = future_to_pr[future]
-                    completed += 1
 
                     try:
                         metrics = future.result()
                         if metrics:
                             prs_with_metrics.append(metrics)
-                            print(
-                                f"  ✓ [{completed}/{len(prs)}] PR #{pr['number']}: {pr['title'][:60]}"
-                            )
                         else:
-                            print(
-                                f"  ✗ [{completed}/{len(prs)}] PR #{pr['number']}: Failed to analyze"
-                            )
+                            logger.error(f"PR #{pr['number']}: Failed to analyze")
                     except Exception as e:
-                        print(f"  ✗ [{completed}/{len(prs)}] PR #{pr['number']}: {e}")
+                        logger.error(f"PR #{pr['number']}: {e}")
+
+                    if completed % _PROGRESS_INTERVAL == 0 or completed == total:
+                        print(f"  [{completed}/{total}] PRs analyzed")
 
             print(f"\n✓ Successfully analyzed {len(prs_with_metrics)}/{len(prs)} PRs")
     except Exception as e:
@@ -223,10 +236,7 @@ Examples:
     # Save outputs
     if args.output:
         json_file = args.output
-        with open(json_file, "w", encoding="utf-8") as f:
-            import json
-
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        save_json_file(output_data, json_file)
         txt_file = None
     else:
         json_file = report_gen.save_json_output(output_data, args.start, args.end, args.author)
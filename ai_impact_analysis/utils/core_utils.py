@@ -1,8 +1,15 @@
 """Utility functions for Jira data analysis."""
 
 import csv
+import json
 import re
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is used otherwise
+    orjson = None
 
 
 def convert_date_to_jql(date_str):
@@ -19,7 +26,7 @@ def convert_date_to_jql(date_str):
         return None
 
     try:
-        input_date = datetime.strptime(date_str, "%Y-%m-%d")
+        input_date = parse_date(date_str)
         today = datetime.now()
 
         days_diff = (today - input_date).days
@@ -34,6 +41,86 @@ def convert_date_to_jql(date_str):
         return f'"{date_str}"'
 
 
+@lru_cache(maxsize=256)
+def parse_date(date_str):
+    """
+    Parse a YYYY-MM-DD date string to a datetime object.
+
+    The same phase boundaries are parsed once per PR or issue, so results are
+    memoized; datetime objects are immutable and safe to share.
+
+    Args:
+        date_str: Date string in YYYY-MM-DD format
+
+    Returns:
+        datetime object at midnight
+
+    Raises:
+        ValueError: If the string is not a valid date
+    """
+    # fromisoformat is only a fast path for the exact zero-padded form: on its own it would
+    # also accept "20240105", times and UTC offsets, which are not valid dates here
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    # strptime also accepts non-padded values such as 2024-1-5
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+def load_json_file(filename):
+    """
+    Load a JSON file, decoding with orjson when it is installed.
+
+    Args:
+        filename: Path to JSON file
+
+    Returns:
+        Decoded JSON document
+    """
+    if orjson is not None:
+        with open(filename, "rb") as f:
+            return orjson.loads(f.read())
+
+    with open(filename, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def loads_json(content):
+    """
+    Decode a JSON document held in memory, using orjson when it is installed.
+
+    Args:
+        content: JSON document as bytes or str
+
+    Returns:
+        Decoded JSON document
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def save_json_file(data, filename, indent=True):
+    """
+    Write data to a JSON file, encoding with orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data
+        filename: Path to output file
+        indent: Pretty-print with two-space indentation
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
+
 def parse_datetime(datetime_str):
     """
     Parse Jira datetime string to datetime object.
@@ -47,13 +134,15 @@ def parse_datetime(datetime_str):
     if not datetime_str:
         return None
 
+    # fromisoformat (Python 3.11+) handles Jira's "+0000" offsets and optional fractional
+    # seconds natively, and is far cheaper than walking strptime format directives
     try:
-        return datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%S.%f%z")
+        parsed = datetime.fromisoformat(datetime_str)
     except ValueError:
-        try:
-            return datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%S%z")
-        except ValueError:
-            return None
+        return None
+
+    # Jira timestamps always carry an offset; reject naive values like strptime's %z did
+    return parsed if parsed.tzinfo is not None else None
 
 
 def calculate_state_durations(issue):
@@ -65,5 +65,19 @@ def setup_logger(name, level=logging.INFO):
     return logger
 
 
+def set_log_level(level, logger_instance=None):
+    """
+    Change the level of a logger and its handlers, e.g. to enable debug output.
+
+    Args:
+        level: Logging level
+        logger_instance: Logger to adjust (default: the package logger)
+    """
+    logger_instance = logger_instance or logger
+    logger_instance.setLevel(level)
+    for handler in logger_instance.handlers:
+        handler.setLevel(level)
+
+
 # Default logger instance for the package
 logger = setup_logger("ai_analysis")
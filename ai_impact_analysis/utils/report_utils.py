@@ -7,9 +7,21 @@ to avoid code duplication.
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional, Any, Tuple, Dict
 
+_NUMERIC_SUFFIX_RE = re.compile(r"-\d+$")
+# Pattern: jira_report_xxx_YYYYMMDD_HHMMSS.txt
+_JIRA_REPORT_TIMESTAMP_RE = re.compile(r"_(\d{8}_\d{6})\.txt$")
+# Pattern: pr_metrics_xxx_YYYYMMDD_YYYYMMDD.json
+_PR_REPORT_TIMESTAMP_RE = re.compile(r"_(\d{8}_\d{8})\.json$")
+
+# Comparison reports are written row by row; a larger buffer cuts write syscalls
+_WRITE_BUFFER_SIZE = 256 * 1024
+# Upper bound on threads used to parse phase reports in parallel
+_MAX_PARSE_WORKERS = 8
+
 
 def normalize_username(username):
     """
@@ -43,7 +55,7 @@ def normalize_username(username):
     if username.startswith("rh-ee-"):
         username = username[6:]  # len("rh-ee-") = 6
     # Remove -1, -2, etc. suffix
-    username = re.sub(r"-\d+$", "", username)
+    username = _NUMERIC_SUFFIX_RE.sub("", username)
     return username
 
 
@@ -175,6 +187,24 @@ def add_metric_change(metric_changes, name, before, after, unit, is_absolute=Fal
             )
 
 
+def write_lines(f, lines):
+    """
+    Write lines to a file, newline-separated, without building the joined text.
+
+    The output is identical to f.write("\n".join(lines)) (no trailing newline).
+
+    Args:
+        f: Writable text file object
+        lines: Iterable of strings without trailing newlines
+    """
+    first = True
+    for line in lines:
+        if not first:
+            f.write("\n")
+        f.write(line)
+        first = False
+
+
 def generate_comparison_report(
     report_files: List[str],
     report_generator: Any,
@@ -192,7 +222,7 @@ def generate_comparison_report(
 
     Args:
         report_files: List of report file paths to compare
-        report_generator: Report generator instance with parse and generate_comparison_tsv methods
+        report_generator: Report generator instance with parse and iter_comparison_rows methods
         phase_names: List of phase names
         identifier: Optional identifier (assignee for Jira, author for PR)
         output_dir: Output directory for the comparison report
@@ -205,20 +235,22 @@ def generate_comparison_report(
     """
     # Parse all reports
     print("Parsing reports...")
-    parsed_reports = []
+    if report_type == "jira":
+        parse_report = report_generator.parse_jira_report
+    else:  # pr
+        parse_report = report_generator.parse_pr_report
 
-    for report_file in report_files:
-        print(f"  Parsing {os.path.basename(report_file)}...")
-        if report_type == "jira":
-            parsed = report_generator.parse_jira_report(report_file)
-        else:  # pr
-            parsed = report_generator.parse_pr_report(report_file)
-        parsed_reports.append(parsed)
+    print("\n".join(f"  Parsing {os.path.basename(f)}..." for f in report_files))
+
+    # Report files are independent; parse them concurrently (map keeps input order)
+    max_workers = max(1, min(len(report_files), _MAX_PARSE_WORKERS))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parsed_reports = list(executor.map(parse_report, report_files))
 
     # Generate comparison TSV
     print("\nGenerating comparison report...")
 
-    # Build kwargs for generate_comparison_tsv
+    # Build kwargs for iter_comparison_rows
     tsv_kwargs = {
         "reports": parsed_reports,
         "phase_names": phase_names,
@@ -234,7 +266,8 @@ def generate_comparison_report(
     if phase_configs:
         tsv_kwargs["phase_configs"] = phase_configs
 
-    comparison_tsv = report_generator.generate_comparison_tsv(**tsv_kwargs)
+    # Rows are streamed straight to the output file as they are produced
+    rows = report_generator.iter_comparison_rows(**tsv_kwargs)
 
     # Determine output filename
     os.makedirs(output_dir, exist_ok=True)
@@ -247,11 +280,9 @@ def generate_comparison_report(
 
         # Different timestamp patterns for different report types
         if report_type == "jira":
-            # Pattern: jira_report_xxx_YYYYMMDD_HHMMSS.txt
-            timestamp_match = re.search(r"_(\d{8}_\d{6})\.txt$", last_report_file)
+            timestamp_match = _JIRA_REPORT_TIMESTAMP_RE.search(last_report_file)
         else:  # pr
-            # Pattern: pr_metrics_xxx_YYYYMMDD_YYYYMMDD.json
-            timestamp_match = re.search(r"_(\d{8}_\d{8})\.json$", last_report_file)
+            timestamp_match = _PR_REPORT_TIMESTAMP_RE.search(last_report_file)
 
         if timestamp_match:
             timestamp = timestamp_match.group(1)
@@ -267,15 +298,17 @@ def generate_comparison_report(
         output_path = os.path.join(output_dir, filename)
 
     # Write output
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(comparison_tsv)
-
-    print(f"\n✓ Report generated: {output_path}")
-    print("\nYou can now:")
-    print(f"  1. Open {output_path} in any text editor")
-    print("  2. Copy all content (Ctrl+A, Ctrl+C)")
-    print("  3. Paste directly into Google Sheets (no need to split columns)")
-    print("  4. The data will automatically be placed in separate columns")
+    with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        write_lines(f, rows)
+
+    print(
+        f"\n✓ Report generated: {output_path}\n"
+        "\nYou can now:\n"
+        f"  1. Open {output_path} in any text editor\n"
+        "  2. Copy all content (Ctrl+A, Ctrl+C)\n"
+        "  3. Paste directly into Google Sheets (no need to split columns)\n"
+        "  4. The data will automatically be placed in separate columns"
+    )
 
     return output_path
 
@@ -308,10 +341,8 @@ def combine_comparison_reports(
     else:
         pattern = str(reports_dir / "pr_comparison_*_*.tsv")
 
-    all_files = glob.glob(pattern)
-
     # Include all reports (both general and individual members)
-    report_files = all_files
+    report_files = glob.glob(pattern)
 
     if not report_files:
         raise ValueError(f"No {report_type} comparison reports found in {reports_dir}")
@@ -415,23 +446,23 @@ def combine_comparison_reports(
         sorted_members.remove("general")
         sorted_members.insert(0, "general")
 
+    # Header: Phase + all members (display "team" instead of "general")
+    display_members = ["team" if m == "general" else m for m in sorted_members]
+    header = "Phase\t" + "\t".join(display_members)
+
     # For each metric, create a section
     for metric in all_metrics:
         lines.append(f"=== {metric} ===")
-
-        # Header: Phase + all members (display "team" instead of "general")
-        display_members = ["team" if m == "general" else m for m in sorted_members]
-        header = "Phase\t" + "\t".join(display_members)
         lines.append(header)
 
+        # Look up each member's values for this metric once, not once per phase
+        member_values = [members_data[member].get(metric, []) for member in sorted_members]
+
         # For each phase, gather all members' values
         for phase_idx, phase_name in enumerate(phase_names):
             row_values = [phase_name]
 
-            for member in sorted_members:
-                member_data = members_data.get(member, {})
-                metric_values = member_data.get(metric, [])
-
+            for metric_values in member_values:
                 # Get value for this phase
                 if phase_idx < len(metric_values):
                     row_values.append(metric_values[phase_idx])
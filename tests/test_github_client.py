@@ -1,7 +1,9 @@
 """Unit tests for GitHubClient."""
 
 import os
+import time
 import pytest
+import requests
 from unittest.mock import Mock, patch
 from ai_impact_analysis.clients.github_client import GitHubClient
 
@@ -43,7 +45,7 @@ class TestGitHubClient:
             with pytest.raises(ValueError, match="Repository owner and name are required"):
                 GitHubClient(token="token")
 
-    @patch("ai_impact_analysis.clients.github_client.requests.get")
+    @patch("ai_impact_analysis.clients.github_client.requests.Session.get")
     def test_fetch_merged_prs_success(self, mock_get):
         """Test fetching merged PRs successfully."""
         # Mock first page with one PR
@@ -75,7 +77,7 @@ class TestGitHubClient:
         assert prs[0]["number"] == 1
         assert prs[0]["title"] == "Test PR"
 
-    @patch("ai_impact_analysis.clients.github_client.requests.get")
+    @patch("ai_impact_analysis.clients.github_client.requests.Session.get")
     def test_fetch_merged_prs_http_error(self, mock_get):
         """Test fetching PRs with HTTP error."""
         mock_response = Mock()
@@ -87,7 +89,7 @@ class TestGitHubClient:
         with pytest.raises(Exception, match="HTTP Error"):
             client.fetch_merged_prs("2024-10-01", "2024-10-31")
 
-    @patch("ai_impact_analysis.clients.github_client.requests.get")
+    @patch("ai_impact_analysis.clients.github_client.requests.Session.get")
     def test_get_pr_commits(self, mock_get):
         """Test getting PR commits."""
         mock_response = Mock()
@@ -103,7 +105,7 @@ class TestGitHubClient:
         assert len(commits) == 1
         assert commits[0]["sha"] == "abc123"
 
-    @patch("ai_impact_analysis.clients.github_client.requests.get")
+    @patch("ai_impact_analysis.clients.github_client.requests.Session.get")
     def test_get_pr_reviews(self, mock_get):
         """Test getting PR reviews."""
         mock_response = Mock()
@@ -124,7 +126,7 @@ class TestGitHubClient:
         assert len(reviews) == 1
         assert reviews[0]["state"] == "APPROVED"
 
-    @patch("ai_impact_analysis.clients.github_client.requests.get")
+    @patch("ai_impact_analysis.clients.github_client.requests.Session.get")
     def test_get_pr_comments(self, mock_get):
         """Test getting PR comments."""
         # Mock review comments
@@ -290,7 +292,7 @@ class TestGitHubClient:
             "changed_files": 0,  # List endpoint may not have this
         }
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
+        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo", use_cache=False)
         metrics = client.get_pr_detailed_metrics(pr_data)
 
         assert metrics["pr_number"] == 1
@@ -306,6 +308,48 @@ class TestGitHubClient:
         assert metrics["deletions"] == 50
         assert metrics["changed_files"] == 5
 
+    @patch("ai_impact_analysis.clients.github_client.time.sleep")
+    @patch("ai_impact_analysis.clients.github_client.requests.Session.get")
+    def test_primary_rate_limit_waits_for_reset(self, mock_get, mock_sleep):
+        """Test that a 403 with no requests remaining waits for the reset and retries."""
+        limited = Mock()
+        limited.status_code = 403
+        limited.headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 30),
+        }
+        ok = Mock()
+        ok.status_code = 200
+        ok.headers = {"X-RateLimit-Remaining": "4999"}
+        ok.json.return_value = [{"sha": "abc123"}]
+        mock_get.side_effect = [limited, ok]
+
+        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
+        commits = client.get_pr_commits(1)
+
+        assert commits == [{"sha": "abc123"}]
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 32
+
+    @patch("ai_impact_analysis.clients.github_client.time.sleep")
+    @patch("ai_impact_analysis.clients.github_client.requests.Session.get")
+    def test_primary_rate_limit_far_reset_fails(self, mock_get, mock_sleep):
+        """Test that a rate limit resetting too far ahead fails with a clear error."""
+        limited = Mock()
+        limited.status_code = 403
+        limited.headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+        mock_get.return_value = limited
+
+        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
+
+        with pytest.raises(requests.exceptions.HTTPError, match="rate limit exhausted"):
+            client.get_pr_commits(1)
+        mock_sleep.assert_not_called()
+
     def test_is_bot_user(self):
         """Test bot user detection."""
         assert GitHubClient.is_bot_user("coderabbit") is True
@@ -320,5 +364,76 @@ class TestGitHubClient:
         assert GitHubClient.is_bot_user(None) is False
 
 
+class TestPRMetricsCache:
+    """Test the on-disk cache of detailed PR metrics."""
+
+    PR = {"number": 7, "merged_at": "2024-10-15T14:00:00Z"}
+
+    @staticmethod
+    def _metrics(pr, **extra):
+        """Build a minimal detailed-metrics dict for a PR."""
+        return {"pr_number": pr["number"], "merged_at": pr["merged_at"], **extra}
+
+    def _client(self, tmp_path, repo_name="repo"):
+        """Create a client whose PR metrics cache lives under tmp_path."""
+        return GitHubClient(
+            token="token", repo_owner="owner", repo_name=repo_name, cache_dir=str(tmp_path)
+        )
+
+    def test_cache_hit(self, tmp_path):
+        """Test that a PR analyzed before is served from the cache."""
+        client = self._client(tmp_path)
+        metrics = self._metrics(self.PR, additions=10)
+
+        with patch.object(GitHubClient, "_analyze_pr", return_value=metrics) as mock_analyze:
+            first = client.get_pr_detailed_metrics(self.PR)
+            second = client.get_pr_detailed_metrics(self.PR)
+
+        mock_analyze.assert_called_once()
+        assert first == second == metrics
+        assert (tmp_path / "owner" / "repo" / "pr_7.json").exists()
+
+    def test_cache_miss_on_new_merged_at(self, tmp_path):
+        """Test that a cached entry for a different merge time is reanalyzed."""
+        client = self._client(tmp_path)
+        remerged = dict(self.PR, merged_at="2024-10-20T09:00:00Z")
+
+        with patch.object(
+            GitHubClient,
+            "_analyze_pr",
+            side_effect=[self._metrics(self.PR), self._metrics(remerged)],
+        ) as mock_analyze:
+            client.get_pr_detailed_metrics(self.PR)
+            metrics = client.get_pr_detailed_metrics(remerged)
+
+        assert mock_analyze.call_count == 2
+        assert metrics["merged_at"] == "2024-10-20T09:00:00Z"
+
+    def test_cache_is_per_repository(self, tmp_path):
+        """Test that the same PR number in another repository is not served from the cache."""
+        with patch.object(
+            GitHubClient,
+            "_analyze_pr",
+            side_effect=[self._metrics(self.PR, title="A"), self._metrics(self.PR, title="B")],
+        ) as mock_analyze:
+            first = self._client(tmp_path, "repo-a").get_pr_detailed_metrics(self.PR)
+            second = self._client(tmp_path, "repo-b").get_pr_detailed_metrics(self.PR)
+
+        assert mock_analyze.call_count == 2
+        assert (first["title"], second["title"]) == ("A", "B")
+
+    def test_clear_cache(self, tmp_path):
+        """Test that clear_cache removes only this repository's entries."""
+        with patch.object(GitHubClient, "_analyze_pr", return_value=self._metrics(self.PR)):
+            client = self._client(tmp_path, "repo-a")
+            client.get_pr_detailed_metrics(self.PR)
+            self._client(tmp_path, "repo-b").get_pr_detailed_metrics(self.PR)
+
+        client.clear_cache()
+
+        assert not (tmp_path / "owner" / "repo-a" / "pr_7.json").exists()
+        assert (tmp_path / "owner" / "repo-b" / "pr_7.json").exists()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,223 @@
+"""Tests for Jira metrics calculator."""
+
+import os
+import time
+from unittest.mock import Mock, patch
+
+from ai_impact_analysis.core.jira_metrics_calculator import JiraMetricsCalculator
+
+
+def _make_calculator(**kwargs):
+    """Create a calculator that never touches a real Jira instance."""
+    kwargs.setdefault("use_cache", False)
+    return JiraMetricsCalculator(
+        jira_url="https://test.jira.com", jira_token="token", project_key="TEST", **kwargs
+    )
+
+
+def _fake_search(total, page_cap=None, fail_at=None, echo_max_results=True):
+    """
+    Build a fetch_jira_data stand-in serving issues T-0 .. T-<total-1>.
+
+    Later pages answer faster than earlier ones, so concurrent fetches complete out of order.
+    """
+    requested = []
+
+    def fetch_jira_data(jql_query, start_at=0, max_results=50, expand=None, fields=None):
+        if expand is None and max_results == 1:
+            return {"total": total, "issues": []}
+
+        requested.append(start_at)
+        if start_at == fail_at:
+            return None
+
+        time.sleep(0.002 * (total - start_at) / total)
+        page_size = min(max_results, page_cap) if page_cap else max_results
+        end = min(start_at + page_size, total)
+        page = {
+            "startAt": start_at,
+            "total": total,
+            "issues": [{"key": f"T-{i}"} for i in range(start_at, end)],
+        }
+        if echo_max_results:
+            page["maxResults"] = page_size
+        return page
+
+    return fetch_jira_data, requested
+
+
+class TestIterIssues:
+    """Test concurrent, in-order paging through search results."""
+
+    def test_iter_issues_preserves_query_order(self):
+        """Test that pages fetched concurrently are yielded in query order."""
+        calculator = _make_calculator()
+        fetch, requested = _fake_search(total=1000)
+
+        with patch.object(calculator, "fetch_jira_data", side_effect=fetch):
+            keys = [issue["key"] for issue in calculator.iter_issues("project = TEST", 50)]
+
+        assert keys == [f"T-{i}" for i in range(1000)]
+        assert sorted(requested) == list(range(0, 1000, 50))
+
+    def test_iter_issues_stops_at_failed_page(self):
+        """Test that a failed page ends iteration after the issues before it."""
+        calculator = _make_calculator()
+        fetch, requested = _fake_search(total=1000, fail_at=300)
+
+        with patch.object(calculator, "fetch_jira_data", side_effect=fetch):
+            keys = [issue["key"] for issue in calculator.iter_issues("project = TEST", 50)]
+
+        assert keys == [f"T-{i}" for i in range(300)]
+        # Pages already in flight may finish, but no page is requested twice
+        assert len(requested) == len(set(requested))
+
+    def test_iter_issues_adapts_to_server_capped_page_size(self):
+        """Test that a maxResults cap below the batch size neither skips nor repeats issues."""
+        calculator = _make_calculator()
+        fetch, requested = _fake_search(total=1050, page_cap=100)
+
+        with patch.object(calculator, "fetch_jira_data", side_effect=fetch):
+            keys = [issue["key"] for issue in calculator.iter_issues("project = TEST", 500)]
+
+        assert keys == [f"T-{i}" for i in range(1050)]
+        assert sorted(requested) == list(range(0, 1050, 100))
+
+    def test_iter_issues_short_last_page_is_not_a_cap(self, capsys):
+        """Test that a first page shorter than the batch size is not reported as a cap."""
+        calculator = _make_calculator()
+        fetch, requested = _fake_search(total=30, echo_max_results=False)
+
+        with patch.object(calculator, "fetch_jira_data", side_effect=fetch):
+            keys = [issue["key"] for issue in calculator.iter_issues("project = TEST", 50)]
+
+        assert keys == [f"T-{i}" for i in range(30)]
+        assert requested == [0]
+        assert "capped" not in capsys.readouterr().out
+
+    def test_fetch_all_issues_matches_iter_issues(self):
+        """Test that fetch_all_issues collects the same issues as iter_issues."""
+        calculator = _make_calculator()
+        fetch, _ = _fake_search(total=120)
+
+        with patch.object(calculator, "fetch_jira_data", side_effect=fetch):
+            issues = calculator.fetch_all_issues("project = TEST", batch_size=50)
+
+        assert [issue["key"] for issue in issues] == [f"T-{i}" for i in range(120)]
+
+
+def _search_response(total):
+    """Build a successful mocked search response."""
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.content = f'{{"total": {total}, "issues": []}}'.encode()
+    return response
+
+
+class TestSearchCache:
+    """Test the on-disk cache of Jira search responses."""
+
+    def test_fetch_jira_data_cache_hit(self, tmp_path):
+        """Test that a repeated request is served from the cache."""
+        calculator = _make_calculator(cache_dir=str(tmp_path), use_cache=True)
+
+        with patch.object(calculator.session, "get", return_value=_search_response(7)) as get:
+            first = calculator.fetch_jira_data('project = "TEST"')
+            second = calculator.fetch_jira_data('project = "TEST"')
+
+        get.assert_called_once()
+        assert first == second == {"total": 7, "issues": []}
+        assert len(list(tmp_path.glob("search_*.json"))) == 1
+
+    def test_fetch_jira_data_cache_expired(self, tmp_path):
+        """Test that an entry older than the TTL is refetched and replaced."""
+        calculator = _make_calculator(cache_dir=str(tmp_path), use_cache=True)
+        with patch.object(calculator.session, "get", return_value=_search_response(7)):
+            calculator.fetch_jira_data('project = "TEST"')
+
+        (cache_file,) = tmp_path.glob("search_*.json")
+        two_days_ago = time.time() - 2 * 24 * 3600
+        os.utime(cache_file, (two_days_ago, two_days_ago))
+
+        with patch.object(calculator.session, "get", return_value=_search_response(9)) as get:
+            result = calculator.fetch_jira_data('project = "TEST"')
+
+        get.assert_called_once()
+        assert result["total"] == 9
+        assert cache_file.stat().st_mtime > two_days_ago
+
+    def test_failed_save_keeps_previous_entry(self, tmp_path):
+        """Test that an interrupted write neither truncates the entry nor leaves temp files."""
+        calculator = _make_calculator(cache_dir=str(tmp_path), use_cache=True)
+        with patch.object(calculator.session, "get", return_value=_search_response(7)):
+            calculator.fetch_jira_data('project = "TEST"')
+        (cache_file,) = tmp_path.glob("search_*.json")
+
+        def interrupted_save(data, filename, indent=True):
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write('{"total": ')
+            raise OSError("disk full")
+
+        with patch(
+            "ai_impact_analysis.core.jira_metrics_calculator.save_json_file",
+            side_effect=interrupted_save,
+        ):
+            calculator._save_to_cache(cache_file, {"total": 9, "issues": []})
+
+        assert list(tmp_path.iterdir()) == [cache_file]
+        assert calculator._load_from_cache(cache_file) == {"total": 7, "issues": []}
+
+    def test_expired_entries_pruned_on_init(self, tmp_path):
+        """Test that entries past the TTL are deleted even if their key is never requested."""
+        stale = tmp_path / "search_stale.json"
+        fresh = tmp_path / "search_fresh.json"
+        stale.write_text("{}")
+        fresh.write_text("{}")
+        two_days_ago = time.time() - 2 * 24 * 3600
+        os.utime(stale, (two_days_ago, two_days_ago))
+
+        _make_calculator(cache_dir=str(tmp_path), use_cache=True)
+
+        assert not stale.exists()
+        assert fresh.exists()
+
+    def test_fetch_jira_data_no_cache(self, tmp_path):
+        """Test that with caching disabled (--no-cache) every request hits Jira."""
+        calculator = _make_calculator(cache_dir=str(tmp_path), use_cache=False)
+
+        with patch.object(calculator.session, "get", return_value=_search_response(7)) as get:
+            calculator.fetch_jira_data('project = "TEST"')
+            calculator.fetch_jira_data('project = "TEST"')
+
+        assert get.call_count == 2
+        assert not list(tmp_path.iterdir())
+
+
+class TestCalculateVelocity:
+    """Test story point velocity over streamed pages."""
+
+    def test_calculate_velocity_skips_failed_pages(self):
+        """Test that story points are summed across pages and failed pages are skipped."""
+        calculator = _make_calculator()
+
+        def fetch_jira_data(jql_query, start_at=0, max_results=50, expand=None, fields=None):
+            if max_results == 1:
+                return {"total": 6, "issues": []}
+            if start_at == 2:
+                return None
+            points = {0: [3, None], 4: [5.0, "2"]}[start_at]
+            return {
+                "maxResults": 2,
+                "issues": [{"fields": {fields: value}} for value in points],
+            }
+
+        with patch.object(calculator, "fetch_jira_data", side_effect=fetch_jira_data):
+            velocity = calculator.calculate_velocity("TEST", batch_size=2)
+
+        assert velocity == {
+            "total_stories": 6,
+            "stories_with_points": 3,
+            "total_story_points": 10.0,
+            "avg_points_per_story": 10.0 / 3,
+        }
@@ -0,0 +1,165 @@
+"""Tests for Jira report generator."""
+
+from ai_impact_analysis.core.jira_report_generator import JiraReportGenerator
+
+SAMPLE_REPORT = """\
+====================================================================================================
+JIRA Data Analysis Report
+====================================================================================================
+Generated: 2024-07-01 09:00:00
+
+Project: P
+Assignee: wlin
+JQL Query: project = "P" AND assignee = "wlin"
+
+--- Data Time Range ---
+Start: 2024-01-01
+End: 2024-01-31
+Leave Days: 2.5 days
+Capacity: 0.8
+Earliest Resolved: 2024-01-03
+Latest Resolved: 2024-01-30
+Data Span: 30 days
+
+--- Issue Type Statistics ---
+Total: 10 issues
+  Story                    6 ( 60.0%)
+  Bug                      4 ( 40.0%)
+
+--- Task Closure Time Statistics ---
+Successfully analyzed issues: 10
+Average Closure Time: 4.50 days (108.00 hours)
+Shortest Closure Time: 0.50 days
+Longest Closure Time: 12.25 days
+
+--- State Duration Analysis ---
+
+Analyzed 10 issues state transitions
+
+State                Occurrences  Issues Affected Avg Duration         Total Duration
+====================================================================================================
+New                  10           10              1.50 days            15.00 days
+In Progress          12           9               36.00 hours          18.00 days
+Review               8            8               0.75 days            6.00 days
+
+--- Detailed State Analysis ---
+
+New:
+  - 10 issues experienced this state
+  - Average times per issue entering this state 1.00 times
+
+In Progress:
+  - 9 issues experienced this state
+  - Average times per issue entering this state 1.33 times
+
+Review:
+  - 8 issues experienced this state
+  - Average times per issue entering this state 1.00 times
+
+Total: 99 issues
+Start: 1999-01-01
+Leave Days: 40 days
+"""
+
+
+class TestParseJiraReport:
+    """Test parsing of text reports."""
+
+    def test_parse_jira_report(self, tmp_path):
+        """Test parsing every section of a report."""
+        report = tmp_path / "jira_report_wlin_20240101_20240131.txt"
+        report.write_text(SAMPLE_REPORT, encoding="utf-8")
+
+        data = JiraReportGenerator().parse_jira_report(str(report))
+
+        assert data == {
+            "filename": str(report),
+            "assignee": "wlin",
+            "jql_query": 'project = "P" AND assignee = "wlin"',
+            "time_range": {
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-31",
+                "leave_days": 2.5,
+                "capacity": 0.8,
+                "earliest_resolved": "2024-01-03",
+                "latest_resolved": "2024-01-30",
+                "span_days": 30,
+            },
+            "issue_types": {
+                "Story": {"count": 6, "percentage": 60.0},
+                "Bug": {"count": 4, "percentage": 40.0},
+            },
+            "total_issues": 10,
+            "closure_stats": {"avg_days": 4.5, "max_days": 12.25},
+            "state_times": {"New": 1.5, "In Progress": 1.5, "Review": 0.75},
+            "state_reentry": {"New": 1.0, "In Progress": 1.33, "Review": 1.0},
+        }
+
+    def test_header_lines_after_state_section_ignored(self, tmp_path):
+        """Test that header-like lines after the state section do not override the header."""
+        report = tmp_path / "report.txt"
+        report.write_text(SAMPLE_REPORT, encoding="utf-8")
+
+        data = JiraReportGenerator().parse_jira_report(str(report))
+
+        assert data["total_issues"] == 10
+        assert data["time_range"]["start_date"] == "2024-01-01"
+        assert data["time_range"]["leave_days"] == 2.5
+
+
+class TestIterComparisonRows:
+    """Test the TSV comparison report rows."""
+
+    def test_iter_comparison_rows(self, tmp_path):
+        """Test the comparison rows built from two parsed reports."""
+        generator = JiraReportGenerator()
+        report = tmp_path / "report.txt"
+        report.write_text(SAMPLE_REPORT, encoding="utf-8")
+        first = generator.parse_jira_report(str(report))
+        second = {
+            "filename": "second.txt",
+            "time_range": {"start_date": "2024-02-01", "end_date": "2024-02-29"},
+            "issue_types": {"Task": {"count": 3, "percentage": 100.0}},
+            "total_issues": 3,
+            "closure_stats": {"avg_days": 2.0},
+            "state_times": {"Review": 0.5},
+            "state_reentry": {"Review": 2.0},
+        }
+
+        rows = list(generator.iter_comparison_rows([first, second], ["Before", "After"], "wlin"))
+
+        assert rows == generator.generate_comparison_tsv(
+            [first, second], ["Before", "After"], "wlin"
+        ).split("\n")
+        assert rows[0] == "AI Impact Analysis Report - wlin"
+        assert "Phase 1: Before (2024-01-01 to 2024-01-31)" in rows
+        assert "Phase 2: After (2024-02-01 to 2024-02-29)" in rows
+        expected_rows = [
+            "Metric\tBefore\tAfter",
+            "Analysis Period\t30d\tN/A",
+            "Leave Days\t2.5\t0",
+            "Capacity\t0.8\t1.0",
+            "Total Issues Completed\t10\t3",
+            "Average Closure Time\t4.50d\t2.00d",
+            "Longest Closure Time\t12.25d\t0.00d",
+            "Daily Throughput (skip leave days)\t0.36/d\tN/A",
+            "Daily Throughput (based on capacity)\t0.42/d\tN/A",
+            "Daily Throughput (considering leave days + capacity)\t0.45/d\tN/A",
+            "Daily Throughput\t0.33/d\tN/A",
+            "New State Avg Time\t1.50d\tN/A",
+            "To Do State Avg Time\tN/A\tN/A",
+            "In Progress State Avg Time\t1.50d\tN/A",
+            "Review State Avg Time\t0.75d\t0.50d",
+            "Release Pending State Avg Time\tN/A\tN/A",
+            "Waiting State Avg Time\tN/A\tN/A",
+            "To Do Re-entry Rate\tN/A\tN/A",
+            "In Progress Re-entry Rate\t1.33x\tN/A",
+            "Review Re-entry Rate\t1.00x\t2.00x",
+            "Waiting Re-entry Rate\tN/A\tN/A",
+            "Story Percentage\t60.00%\t0.00%",
+            "Task Percentage\t0.00%\t100.00%",
+            "Bug Percentage\t40.00%\t0.00%",
+            "Epic Percentage\t0.00%\t0.00%",
+        ]
+        start = rows.index("Metric\tBefore\tAfter")
+        assert rows[start : start + len(expected_rows)] == expected_rows
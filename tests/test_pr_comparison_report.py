@@ -0,0 +1,44 @@
+"""Tests for the PR comparison report script."""
+
+from ai_impact_analysis.scripts.generate_pr_comparison_report import parse_phase_config
+
+
+class TestParsePhaseConfig:
+    """Test GITHUB_PHASES config parsing."""
+
+    def test_parse_phase_config(self, tmp_path):
+        """Test parsing a multi-line phase array with comments."""
+        config = tmp_path / "github_phases.conf"
+        config.write_text(
+            "# Phase definitions\n"
+            "GITHUB_PHASES=(\n"
+            '    "Before AI|2024-01-01|2024-03-31"\n'
+            '    # "Skipped|2024-04-01|2024-04-30"\n'
+            '    "With AI|2024-05-01|2024-06-30"\n'
+            ")\n"
+        )
+
+        assert parse_phase_config(str(config)) == [
+            ("Before AI", "2024-01-01", "2024-03-31"),
+            ("With AI", "2024-05-01", "2024-06-30"),
+        ]
+
+    def test_parse_phase_config_parentheses_in_name(self, tmp_path):
+        """Test that parentheses inside a quoted phase name do not end the array."""
+        config = tmp_path / "github_phases.conf"
+        config.write_text(
+            "GITHUB_PHASES=(\n"
+            '    "Phase 1 (pilot)|2024-01-01|2024-03-31"\n'
+            '    "Phase 2|2024-04-01|2024-06-30"\n'
+            ")\n"
+            'OTHER=("Ignored|2024-07-01|2024-07-31")\n'
+        )
+
+        assert parse_phase_config(str(config)) == [
+            ("Phase 1 (pilot)", "2024-01-01", "2024-03-31"),
+            ("Phase 2", "2024-04-01", "2024-06-30"),
+        ]
+
+    def test_parse_phase_config_missing_file(self, tmp_path):
+        """Test that a missing config file yields no phases."""
+        assert parse_phase_config(str(tmp_path / "missing.conf")) == []
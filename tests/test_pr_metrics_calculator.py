@@ -0,0 +1,126 @@
+"""Tests for PR metrics calculator."""
+
+import pytest
+
+from ai_impact_analysis.core.pr_metrics_calculator import PRMetricsCalculator
+
+_FIELDS = (
+    "time_to_merge_days",
+    "time_to_first_review_hours",
+    "changes_requested_count",
+    "total_commits",
+    "reviewers_count",
+    "total_comments_count",
+    "additions",
+    "deletions",
+    "changed_files",
+    "human_reviewers_count",
+    "human_substantive_comments_count",
+)
+
+
+def _pr(ai_tools, *values):
+    """Build a PR metrics dict from its AI tools and the _FIELDS values, in order."""
+    return {"has_ai_assistance": bool(ai_tools), "ai_tools": ai_tools, **dict(zip(_FIELDS, values))}
+
+
+# Claude only, Cursor only, both tools, and two PRs without AI assistance. One PR has no
+# first review (None) and one has a zero first-review time.
+PRS = [
+    _pr(["Claude"], 1.0, 2.0, 0, 2, 1, 4, 10, 2, 1, 1, 2),
+    _pr(["Cursor"], 2.0, None, 1, 4, 2, 6, 30, 4, 3, 2, 4),
+    _pr(["Claude", "Cursor"], 3.0, 4.0, 2, 6, 3, 8, 50, 6, 5, 1, 0),
+    _pr([], 4.0, 0, 3, 1, 1, 2, 100, 20, 2, 1, 1),
+    _pr([], 6.0, 8.0, 1, 3, 3, 4, 200, 40, 4, 2, 3),
+]
+
+
+class TestCalculateStatistics:
+    """Test aggregated PR statistics."""
+
+    def test_bucket_averages(self):
+        """Test the AI and non-AI averages and the comparison figures."""
+        stats = PRMetricsCalculator().calculate_statistics(PRS)
+
+        assert stats["total_prs"] == 5
+        assert stats["ai_assisted_prs"] == 3
+        assert stats["non_ai_prs"] == 2
+        assert stats["ai_adoption_rate"] == pytest.approx(60.0)
+        # First-review averages leave out PRs with no (None) or a zero first-review time
+        assert stats["ai_stats"] == pytest.approx(
+            {
+                "count": 3,
+                "avg_time_to_merge_days": 2.0,
+                "avg_time_to_first_review_hours": 3.0,
+                "avg_changes_requested": 1.0,
+                "avg_commits": 4.0,
+                "avg_reviewers": 2.0,
+                "avg_comments": 6.0,
+                "avg_additions": 30.0,
+                "avg_deletions": 4.0,
+                "avg_files_changed": 3.0,
+            }
+        )
+        assert stats["non_ai_stats"] == pytest.approx(
+            {
+                "count": 2,
+                "avg_time_to_merge_days": 5.0,
+                "avg_time_to_first_review_hours": 8.0,
+                "avg_changes_requested": 2.0,
+                "avg_commits": 2.0,
+                "avg_reviewers": 2.0,
+                "avg_comments": 3.0,
+                "avg_additions": 150.0,
+                "avg_deletions": 30.0,
+                "avg_files_changed": 3.0,
+            }
+        )
+        assert stats["comparison"] == pytest.approx(
+            {"merge_time_improvement": 60.0, "changes_requested_reduction": 50.0}
+        )
+
+    def test_tool_counts(self):
+        """Test per-tool counts; "both" counts PRs that used Claude and Cursor together."""
+        stats = PRMetricsCalculator().calculate_statistics(PRS)
+
+        assert stats["claude_prs"] == 2
+        assert stats["cursor_prs"] == 2
+        assert stats["both_tools_prs"] == 1
+        assert stats["non_ai_prs"] == 2
+
+    def test_overall_stats_included(self):
+        """Test that the statistics carry the overall averages."""
+        calculator = PRMetricsCalculator()
+
+        stats = calculator.calculate_statistics(PRS)
+
+        assert stats["overall_stats"] == calculator.calculate_overall_metrics(PRS)
+
+    def test_overall_stats_included_without_prs(self):
+        """Test that an empty period still reports overall averages, all zero."""
+        stats = PRMetricsCalculator().calculate_statistics([])
+
+        assert stats["total_prs"] == 0
+        assert stats["overall_stats"]["avg_time_to_merge_days"] == 0
+        assert set(stats["overall_stats"].values()) == {0}
+        assert len(stats["overall_stats"]) == 11
+
+    def test_overall_metrics(self):
+        """Test the overall averages, which skip only missing (None) values."""
+        overall = PRMetricsCalculator().calculate_overall_metrics(PRS)
+
+        assert overall == pytest.approx(
+            {
+                "avg_time_to_merge_days": 3.2,
+                "avg_time_to_first_review_hours": 3.5,
+                "avg_changes_requested": 1.4,
+                "avg_commits": 3.2,
+                "avg_reviewers": 2.0,
+                "avg_human_reviewers": 1.4,
+                "avg_comments": 4.8,
+                "avg_human_substantive_comments": 2.0,
+                "avg_additions": 78.0,
+                "avg_deletions": 14.4,
+                "avg_files_changed": 3.0,
+            }
+        )
@@ -0,0 +1,66 @@
+"""Tests for PR report generator."""
+
+from unittest.mock import patch
+
+from ai_impact_analysis.core import pr_report_generator
+from ai_impact_analysis.core.pr_report_generator import PRReportGenerator
+from ai_impact_analysis.utils.core_utils import save_json_file
+
+
+def _write_report(path, total_prs=2):
+    """Write a minimal PR metrics report."""
+    save_json_file(
+        {
+            "period": {"start_date": "2024-10-01", "end_date": "2024-10-31"},
+            "statistics": {"total_prs": total_prs, "non_ai_stats": {"avg_commits": 3.0}},
+            "prs": [{"additions": 10, "deletions": 2, "changed_files": 1}],
+        },
+        path,
+    )
+
+
+class TestParsePRReportCache:
+    """Test the on-disk cache of parsed PR reports."""
+
+    def test_parse_pr_report_cache_hit(self, tmp_path):
+        """Test that an unchanged report is served from the cache."""
+        report = tmp_path / "pr_metrics_general_20241001_20241031.json"
+        _write_report(report)
+        generator = PRReportGenerator(parse_cache_dir=str(tmp_path / "cache"))
+
+        first = generator.parse_pr_report(str(report))
+        with patch.object(PRReportGenerator, "_parse_pr_report_file") as mock_parse:
+            second = generator.parse_pr_report(str(report))
+
+        mock_parse.assert_not_called()
+        assert second == first
+        assert second["total_prs"] == 2
+        assert second["avg_commits"] == 3.0
+
+    def test_parse_pr_report_cache_version_change(self, tmp_path):
+        """Test that entries cached by another parser version are not served."""
+        report = tmp_path / "pr_metrics_general_20241001_20241031.json"
+        _write_report(report)
+        generator = PRReportGenerator(parse_cache_dir=str(tmp_path / "cache"))
+        generator.parse_pr_report(str(report))
+
+        with patch.object(pr_report_generator, "_PARSE_CACHE_VERSION", -1):
+            with patch.object(
+                PRReportGenerator, "_parse_pr_report_file", return_value={"total_prs": 5}
+            ) as mock_parse:
+                parsed = generator.parse_pr_report(str(report))
+
+        mock_parse.assert_called_once()
+        assert parsed["total_prs"] == 5
+
+    def test_parse_pr_report_cache_eviction(self, tmp_path):
+        """Test that the oldest entries are removed beyond the entry limit."""
+        generator = PRReportGenerator(parse_cache_dir=str(tmp_path / "cache"))
+
+        with patch.object(pr_report_generator, "_MAX_PARSE_CACHE_ENTRIES", 2):
+            for i in range(3):
+                report = tmp_path / f"pr_metrics_general_{i}.json"
+                _write_report(report, total_prs=i)
+                generator.parse_pr_report(str(report))
+
+        assert len(list((tmp_path / "cache").glob("parsed_*.json"))) == 2
@@ -1,8 +1,13 @@
 """Tests for utility functions."""
 
+import pytest
 from datetime import datetime
 from ai_impact_analysis.utils.core_utils import (
     convert_date_to_jql,
+    parse_date,
+    load_json_file,
+    loads_json,
+    save_json_file,
     parse_datetime,
     build_jql_query,
     calculate_state_durations,
@@ -30,6 +35,66 @@ class TestConvertDateToJQL:
         assert result is None
 
 
+class TestParseDate:
+    """Test YYYY-MM-DD date parsing."""
+
+    def test_parse_date(self):
+        """Test parsing a zero-padded date."""
+        assert parse_date("2024-01-15") == datetime(2024, 1, 15)
+
+    def test_parse_date_not_padded(self):
+        """Test parsing a date without zero padding."""
+        assert parse_date("2024-1-5") == datetime(2024, 1, 5)
+
+    def test_parse_date_invalid(self):
+        """Test parsing an invalid date raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_date("invalid")
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "20240105",
+            "2024-01-05T10:00:00",
+            "2024-01-05 10:00",
+            "2024-01-05T00:00:00+00:00",
+            "2024-W01-1",
+            "2024-02-30",
+        ],
+    )
+    def test_parse_date_rejects_non_date_forms(self, value):
+        """Test that only YYYY-MM-DD dates are accepted."""
+        with pytest.raises(ValueError):
+            parse_date(value)
+
+
+class TestLoadJsonFile:
+    """Test JSON file loading."""
+
+    def test_load_json_file(self, tmp_path):
+        """Test loading a JSON document with non-ASCII text."""
+        path = tmp_path / "report.json"
+        path.write_text('{"prs": [{"number": 1, "title": "Añadir"}]}', encoding="utf-8")
+        assert load_json_file(path) == {"prs": [{"number": 1, "title": "Añadir"}]}
+
+
+class TestSaveJsonFile:
+    """Test JSON file writing."""
+
+    def test_save_json_file_round_trip(self, tmp_path):
+        """Test that saved JSON is indented, keeps non-ASCII text and loads back."""
+        path = tmp_path / "report.json"
+        data = {"state_statistics": {"En revisión": {"issue_count": 2}}}
+        save_json_file(data, path)
+        assert '\n  "state_statistics"' in path.read_text(encoding="utf-8")
+        assert "En revisión" in path.read_text(encoding="utf-8")
+        assert load_json_file(path) == data
+
+    def test_loads_json_bytes(self):
+        """Test decoding a JSON response body."""
+        assert loads_json(b'{"total": 2, "issues": []}') == {"total": 2, "issues": []}
+
+
 class TestParseDatetime:
     """Test datetime parsing."""
 